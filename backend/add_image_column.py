@@ -1,55 +1,26 @@
 """
-Migration script to add image_url column to existing tweets table
-Run this once to update the Render database schema
+Migration script to bring an existing database schema up to date
+Schema changes live in SCHEMA_MIGRATIONS and also run automatically on app startup
 """
-import psycopg2
-import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+from database.postgres_setup import get_db
+
 def add_image_column():
-    """Add image_url column to tweets table"""
-    database_url = os.getenv('DATABASE_URL')
-    
-    if not database_url:
-        database_url = f"postgresql://{os.getenv('POSTGRES_USER', 'postgres')}:{os.getenv('POSTGRES_PASSWORD', 'password')}@{os.getenv('POSTGRES_HOST', 'localhost')}:{os.getenv('POSTGRES_PORT', '5432')}/{os.getenv('POSTGRES_DB', 'disastershield_db')}"
-    
+    """Apply pending column/constraint migrations to the configured database"""
     try:
-        connection = psycopg2.connect(database_url)
-        cursor = connection.cursor()
-        
-        # Check if column already exists
-        cursor.execute("""
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name='tweets' AND column_name='image_url'
-        """)
-        
-        if cursor.fetchone():
-            print("✅ Column 'image_url' already exists")
-        else:
-            # Add the column
-            cursor.execute("ALTER TABLE tweets ADD COLUMN image_url TEXT")
-            connection.commit()
-            print("✅ Successfully added 'image_url' column to tweets table")
-        
-        # Fix api_logs constraint issue
-        cursor.execute("""
-            SELECT constraint_name 
-            FROM information_schema.table_constraints 
-            WHERE table_name='api_logs' AND constraint_type='UNIQUE'
-        """)
+        # get_db() already applies pending migrations when it finds the schema incomplete,
+        # so report those along with anything migrate() still had to do
+        db = get_db()
+        db.migrate()
+        applied = db.applied_migrations
         
-        if not cursor.fetchone():
-            cursor.execute("ALTER TABLE api_logs ADD CONSTRAINT api_logs_endpoint_key UNIQUE (endpoint)")
-            connection.commit()
-            print("✅ Added unique constraint to api_logs table")
+        if applied:
+            print(f"✅ Applied migrations: {', '.join(applied)}")
         else:
-            print("✅ api_logs constraint already exists")
-        
-        cursor.close()
-        connection.close()
+            print("✅ Schema already up to date")
         print("✅ Migration completed successfully!")
         
     except Exception as e:
@@ -1,9 +1,152 @@
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import execute_values
+from psycopg2.extensions import DECIMAL, PYDATETIME, PYDATETIMETZ, connection as BaseConnection, new_type, register_type
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+import hashlib
+import io
 import logging
-from typing import Optional, List, Dict
-import os
+import re
+import threading
+import time
+from collections import Counter
+from itertools import islice
+from contextlib import contextmanager
 from datetime import datetime
+from typing import Optional, List, Dict, Iterable, Tuple
+import os
+
+# Buffered API request counts are written after this many seconds, or sooner once this many hits are waiting
+API_LOG_FLUSH_SECONDS = 5
+API_LOG_FLUSH_EVENTS = 1000
+
+# insert_tweets_bulk calls with at least this many tweets (cold loads, replays) go through bulk_copy_tweets' COPY path
+TWEET_COPY_THRESHOLD = 1000
+
+# Seconds a caller waits for a free pooled connection before giving up
+POOL_TIMEOUT_SECONDS = 30
+
+# Seconds a get_stats result is served from memory; tweet writes drop it early
+STATS_CACHE_SECONDS = 60
+
+# Seconds a get_categories result is served from memory; tweet writes and prunes drop it early
+CATEGORIES_CACHE_SECONDS = 60
+
+# Seconds a user row looked up by username or email is served from memory, and how many are kept
+USER_CACHE_SECONDS = 60
+USER_CACHE_SIZE = 10000
+
+# Columns written by the tweet insert paths, in row order
+TWEET_COLUMNS = (
+    "tweet_id", "text", "username", "user_followers", "tweet_timestamp",
+    "classification_label", "confidence_score", "category", "model_version",
+    "likes", "retweets", "replies", "image_url",
+)
+
+# Tweet upsert fed by {rows}, also folded into the hourly stats rollup: each written row is added to the
+# current hour, and a row that already existed is taken back out of the bucket, label and score it was counted under
+TWEET_UPSERT_SQL = """
+WITH upserted AS (
+INSERT INTO tweets (tweet_id, text, username, user_followers, tweet_timestamp,
+                   classification_label, confidence_score, category, model_version,
+                   likes, retweets, replies, image_url)
+{rows}
+ON CONFLICT (tweet_id) DO UPDATE SET
+classification_label = EXCLUDED.classification_label,
+confidence_score = EXCLUDED.confidence_score,
+category = EXCLUDED.category,
+image_url = EXCLUDED.image_url,
+processed_at = CURRENT_TIMESTAMP
+RETURNING tweet_id, classification_label, confidence_score, is_active
+),
+-- Every part of the statement shares one snapshot, so this reads the updated rows as they were before the upsert
+previous AS (
+SELECT tweets.processed_at, tweets.classification_label, tweets.confidence_score
+FROM tweets JOIN upserted USING (tweet_id)
+WHERE tweets.is_active
+),
+deltas AS (
+SELECT date_trunc('hour', NOW()) AS hour_bucket, classification_label::text AS classification_label,
+       1 AS count, confidence_score
+FROM upserted
+WHERE is_active
+UNION ALL
+SELECT date_trunc('hour', processed_at), classification_label::text, -1, -confidence_score
+FROM previous
+)
+INSERT INTO tweet_stats_hourly (hour_bucket, classification_label, count,
+                                sum_confidence, max_confidence, min_confidence)
+-- Scores lie in [0, 1], so the fallbacks leave GREATEST/LEAST unchanged for buckets that only lose rows
+SELECT hour_bucket, classification_label, SUM(count), SUM(confidence_score),
+       COALESCE(MAX(confidence_score) FILTER (WHERE count > 0), 0),
+       COALESCE(MIN(confidence_score) FILTER (WHERE count > 0), 1)
+FROM deltas
+GROUP BY hour_bucket, classification_label
+-- Rows written before the rollup existed were never counted, so removals only touch buckets it already holds
+HAVING bool_or(count > 0) OR EXISTS (
+    SELECT 1 FROM tweet_stats_hourly AS stats
+    WHERE stats.hour_bucket = deltas.hour_bucket AND stats.classification_label = deltas.classification_label
+)
+ON CONFLICT (hour_bucket, classification_label) DO UPDATE SET
+count = tweet_stats_hourly.count + EXCLUDED.count,
+sum_confidence = tweet_stats_hourly.sum_confidence + EXCLUDED.sum_confidence,
+max_confidence = GREATEST(tweet_stats_hourly.max_confidence, EXCLUDED.max_confidence),
+min_confidence = LEAST(tweet_stats_hourly.min_confidence, EXCLUDED.min_confidence)
+"""
+
+# Column type OIDs that psycopg2 would otherwise return as datetime objects
+DATETIME_TYPE_CODES = PYDATETIME.values + PYDATETIMETZ.values
+
+# Timestamps are read straight from the server's text output as ISO 8601 strings,
+# so rows need no datetime parsing or per-value isoformat() afterwards
+ISO_TIMESTAMP = new_type(
+    DATETIME_TYPE_CODES, "ISO_TIMESTAMP",
+    lambda value, cursor: value.replace(' ', 'T', 1) if value is not None else None
+)
+
+# NUMERIC columns (confidence scores and their aggregates) are read as floats, skipping Decimal construction
+FLOAT_NUMERIC = new_type(
+    DECIMAL.values, "FLOAT_NUMERIC",
+    lambda value, cursor: float(value) if value is not None else None
+)
+
+# Schema changes for databases created by older versions, keyed by table.column, table.constraint,
+# table.column:type or table.column:not_null and applied by PostgreSQLDatabase._migrate when the key is missing
+SCHEMA_MIGRATIONS = (
+    ("tweets.image_url", "ALTER TABLE tweets ADD COLUMN image_url TEXT"),
+    ("tweets.category", "ALTER TABLE tweets ADD COLUMN category VARCHAR(32) NOT NULL DEFAULT 'general'"),
+    ("tweets.tweet_timestamp:not_null", """
+    UPDATE tweets SET tweet_timestamp = COALESCE(processed_at, CURRENT_TIMESTAMP) WHERE tweet_timestamp IS NULL;
+    ALTER TABLE tweets ALTER COLUMN tweet_timestamp SET NOT NULL
+    """),
+    ("tweets.category:not_null", """
+    UPDATE tweets SET category = 'general' WHERE category IS NULL;
+    ALTER TABLE tweets ALTER COLUMN category SET NOT NULL
+    """),
+    ("api_logs.api_logs_endpoint_key", "ALTER TABLE api_logs ADD CONSTRAINT api_logs_endpoint_key UNIQUE (endpoint)"),
+    ("tweets.classification_label:classification_label_t", """
+    ALTER TABLE tweets DROP CONSTRAINT IF EXISTS tweets_classification_label_check;
+    ALTER TABLE tweets ALTER COLUMN classification_label TYPE classification_label_t
+        USING classification_label::classification_label_t
+    """),
+)
+
+# Tables, indexes and types create_tables makes. Startup skips its DDL only when all of these exist and no
+# SCHEMA_MIGRATIONS key is missing, so add new objects here and column or constraint changes to SCHEMA_MIGRATIONS.
+SCHEMA_OBJECTS = (
+    "tweets", "users", "api_logs", "tweet_stats_hourly", "classification_label_t",
+    "idx_classification", "idx_timestamp", "idx_confidence", "idx_tweets_feed", "idx_tweets_feed_all",
+    "idx_tweets_feed_active", "idx_tweets_processed_at", "idx_username", "idx_email", "api_logs_endpoint_key",
+)
+
+# Matches psycopg2 placeholders, named (%(key)s) or positional (%s)
+PLACEHOLDER_RE = re.compile(r"%\(\w+\)s|%s")
+
+class PreparingConnection(BaseConnection):
+    """psycopg2 connection that remembers which statements were PREPAREd on it, reading timestamps as ISO strings and NUMERIC as float"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+        register_type(ISO_TIMESTAMP, self)
+        register_type(FLOAT_NUMERIC, self)
 
 class PostgreSQLDatabase:
     def __init__(self):
@@ -11,47 +154,174 @@ class PostgreSQLDatabase:
         self.database_url = os.getenv('DATABASE_URL')
         if not self.database_url:
             self.database_url = f"postgresql://{os.getenv('POSTGRES_USER', 'postgres')}:{os.getenv('POSTGRES_PASSWORD', 'password')}@{os.getenv('POSTGRES_HOST', 'localhost')}:{os.getenv('POSTGRES_PORT', '5432')}/{os.getenv('POSTGRES_DB', 'disastershield_db')}"
-        
-        # Only create tables if database is available
+
+        # Reads may target a replica; without one both pools point at the primary
+        self.read_database_url = os.getenv('DATABASE_READ_URL') or self.database_url
+
+        # Connection pools are created on first use so startup survives a missing database.
+        # Reads and writes get separate pools so bursts of one cannot starve the other.
+        # psycopg2 pools keep at most min_pool_size idle connections and close the rest on release
+        self.min_pool_size = int(os.getenv('POSTGRES_POOL_MIN', '2'))
+        self.pool_size = int(os.getenv('POSTGRES_POOL_SIZE', '10'))
+        self.read_pool_size = int(os.getenv('POSTGRES_READ_POOL_SIZE', '20'))
+        self._read_pool = None
+        self._write_pool = None
+        self._pool_lock = threading.Lock()
+        # ThreadedConnectionPool raises as soon as every connection is leased; these make callers wait instead
+        self._read_slots = threading.BoundedSemaphore(self.read_pool_size)
+        self._write_slots = threading.BoundedSemaphore(self.pool_size)
+
+        # Feed SELECTs keyed by which filters are applied
+        self._feed_queries = {}
+
+        # Server-side prepared statement text keyed by the original SQL.
+        # Turn PREPARE off behind PgBouncer transaction pooling, where statements do not follow the client.
+        self._statements = {}
+        self.use_prepared = os.getenv('POSTGRES_PREPARED_STATEMENTS', 'true').lower() != 'false'
+
+        # API request counts are buffered in memory and flushed periodically
+        self._api_counter = Counter()
+        self._api_counter_lock = threading.Lock()
+        self._api_flush_timer = None
+
+        # Tweets processed more than this many days ago are removed by prune_tweets, 0 keeps everything
+        self.retention_days = int(os.getenv('TWEET_RETENTION_DAYS', '0'))
+
+        # (expires_at, stats) from the last get_stats call
+        self._stats_cache = None
+
+        # (expires_at, categories) from the last get_categories call
+        self._categories_cache = None
+
+        # (column, value) -> (expires_at, user) for active users found by get_user_by_username/email
+        self._user_cache = {}
+        self._user_cache_lock = threading.Lock()
+
+        # SCHEMA_MIGRATIONS keys applied by this instance, at startup or through migrate()
+        self.applied_migrations = []
+
+        # Only create tables if database is available, and only when the schema is not already in place
         try:
-            self.create_tables()
+            if self.schema_ready():
+                logging.info("PostgreSQL schema already up to date")
+            else:
+                self.create_tables()
         except Exception as e:
             logging.warning(f"Database not available during startup: {e}")
             logging.info("App will continue without database - add PostgreSQL database in Render dashboard")
 
-    def get_connection(self):
-        """Get PostgreSQL connection"""
+    def get_connection(self, read_only: bool = False):
+        """Get PostgreSQL connection from the read or write pool, hand it back with release_connection"""
+        slots = self._read_slots if read_only else self._write_slots
+        if not slots.acquire(timeout=POOL_TIMEOUT_SECONDS):
+            raise PoolError("Timed out waiting for a pooled PostgreSQL connection")
         try:
-            return psycopg2.connect(self.database_url)
+            if self._write_pool is None:
+                with self._pool_lock:
+                    if self._write_pool is None:
+                        self._read_pool = ThreadedConnectionPool(
+                            self.min_pool_size, self.read_pool_size, self.read_database_url, connection_factory=PreparingConnection
+                        )
+                        self._write_pool = ThreadedConnectionPool(
+                            self.min_pool_size, self.pool_size, self.database_url, connection_factory=PreparingConnection
+                        )
+            pool = self._read_pool if read_only else self._write_pool
+            connection = pool.getconn()
+            # A connection dropped while idle (server restart, idle timeout) is replaced rather than handed out
+            while connection.closed:
+                pool.putconn(connection, close=True)
+                connection = pool.getconn()
+            return connection
         except Exception as e:
+            slots.release()
             logging.error(f"Error connecting to PostgreSQL: {e}")
             raise
 
+    def release_connection(self, connection, read_only: bool = False):
+        """Return a connection to the pool it came from, rolling back any open transaction"""
+        try:
+            (self._read_pool if read_only else self._write_pool).putconn(connection)
+        finally:
+            (self._read_slots if read_only else self._write_slots).release()
+
+    @contextmanager
+    def _conn(self, read_only: bool = False):
+        """Lease a pooled connection for the duration of a with-block"""
+        connection = self.get_connection(read_only)
+        try:
+            # Read leases run in autocommit: no transaction is opened, so release needs no ROLLBACK round-trip
+            connection.autocommit = read_only
+            yield connection
+        finally:
+            self.release_connection(connection, read_only)
+
+    @contextmanager
+    def _cursor(self):
+        """Lease a read-only autocommit connection and open a tuple cursor on it"""
+        with self._conn(read_only=True) as connection, connection.cursor() as cursor:
+            yield cursor
+
+    def schema_ready(self) -> bool:
+        """Check whether every relation and type in SCHEMA_OBJECTS exists and no SCHEMA_MIGRATIONS entry is pending"""
+        query = """
+        SELECT bool_and(COALESCE(to_regclass(name)::oid, to_regtype(name)::oid) IS NOT NULL)
+        FROM unnest(%s::text[]) AS name
+        """
+        with self._cursor() as cursor:
+            cursor.execute(query, (list(SCHEMA_OBJECTS),))
+            return cursor.fetchone()[0] and not self._pending_migrations(cursor)
+
     def create_tables(self):
         """Create necessary tables if they don't exist"""
         create_tweets_table = """
+        -- Two-value label stored as a 4-byte enum instead of repeated text
+        DO $$ BEGIN
+            CREATE TYPE classification_label_t AS ENUM ('verified', 'rumor');
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END $$;
+        
         CREATE TABLE IF NOT EXISTS tweets (
             id SERIAL PRIMARY KEY,
             tweet_id VARCHAR(50) UNIQUE NOT NULL,
             text TEXT NOT NULL,
             username VARCHAR(100),
             user_followers INTEGER DEFAULT 0,
-            tweet_timestamp TIMESTAMP,
-            classification_label VARCHAR(20) NOT NULL CHECK (classification_label IN ('verified', 'rumor')),
+            tweet_timestamp TIMESTAMP NOT NULL,
+            classification_label classification_label_t NOT NULL,
             confidence_score DECIMAL(5,4) NOT NULL,
             model_version VARCHAR(20) DEFAULT 'v2.0',
             likes INTEGER DEFAULT 0,
             retweets INTEGER DEFAULT 0,
             replies INTEGER DEFAULT 0,
-            category VARCHAR(50) DEFAULT 'general',
+            category VARCHAR(32) NOT NULL DEFAULT 'general',
             image_url TEXT,
             processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             is_active BOOLEAN DEFAULT TRUE
         );
+        """
         
+        # Runs after _migrate so columns added to older tables are indexable
+        create_tweets_indexes = """
         CREATE INDEX IF NOT EXISTS idx_classification ON tweets(classification_label, confidence_score);
         CREATE INDEX IF NOT EXISTS idx_timestamp ON tweets(tweet_timestamp DESC);
         CREATE INDEX IF NOT EXISTS idx_confidence ON tweets(confidence_score DESC);
+        -- Partial feed indexes per label: equality columns first so ORDER BY tweet_timestamp, tweet_id LIMIT
+        -- stops early and the (tweet_timestamp, tweet_id) keyset cursor seeks straight to the next page,
+        -- with confidence_score carried in the leaf to filter without visiting the heap
+        DROP INDEX IF EXISTS idx_feed;
+        DROP INDEX IF EXISTS idx_tweets_hot;
+        DROP INDEX IF EXISTS idx_tweets_hot_all;
+        DROP INDEX IF EXISTS idx_feed_active;
+        CREATE INDEX IF NOT EXISTS idx_tweets_feed
+            ON tweets(classification_label, category, tweet_timestamp DESC, tweet_id DESC)
+            INCLUDE (confidence_score) WHERE is_active = TRUE;
+        CREATE INDEX IF NOT EXISTS idx_tweets_feed_all ON tweets(classification_label, tweet_timestamp DESC, tweet_id DESC)
+            INCLUDE (confidence_score) WHERE is_active = TRUE;
+        CREATE INDEX IF NOT EXISTS idx_tweets_feed_active ON tweets(is_active, category, tweet_timestamp DESC, tweet_id DESC);
+        -- processed_at serves both prune_tweets' age cutoff and get_last_processed_at's MAX, which a BRIN
+        -- summary cannot answer without scanning every block range
+        DROP INDEX IF EXISTS idx_processed_brin;
+        CREATE INDEX IF NOT EXISTS idx_tweets_processed_at ON tweets(processed_at DESC);
         """
         
         create_users_table = """
@@ -74,249 +344,487 @@ class PostgreSQLDatabase:
         create_api_logs = """
         CREATE TABLE IF NOT EXISTS api_logs (
             id SERIAL PRIMARY KEY,
-            endpoint VARCHAR(100),
+            endpoint VARCHAR(100) CONSTRAINT api_logs_endpoint_key UNIQUE,
             request_count INTEGER DEFAULT 1,
             last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
         """
+        
+        create_stats_rollup = """
+        CREATE TABLE IF NOT EXISTS tweet_stats_hourly (
+            hour_bucket TIMESTAMP NOT NULL,
+            classification_label VARCHAR(20) NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            sum_confidence DECIMAL(14,4) NOT NULL DEFAULT 0,
+            max_confidence DECIMAL(5,4) NOT NULL,
+            min_confidence DECIMAL(5,4) NOT NULL,
+            PRIMARY KEY (hour_bucket, classification_label)
+        );
+        
+        -- Seed an empty rollup from the last day of tweets so stats survive the upgrade
+        INSERT INTO tweet_stats_hourly (hour_bucket, classification_label, count,
+                                        sum_confidence, max_confidence, min_confidence)
+        SELECT date_trunc('hour', processed_at), classification_label, COUNT(*),
+               SUM(confidence_score), MAX(confidence_score), MIN(confidence_score)
+        FROM tweets
+        WHERE processed_at >= NOW() - INTERVAL '24 hours'
+        AND is_active = TRUE
+        AND NOT EXISTS (SELECT 1 FROM tweet_stats_hourly)
+        GROUP BY 1, 2;
+        """
 
-        connection = None
         try:
-            connection = self.get_connection()
-            cursor = connection.cursor()
-            
-            cursor.execute(create_tweets_table)
-            cursor.execute(create_users_table)
-            cursor.execute(create_api_logs)
-            
-            connection.commit()
-            logging.info("PostgreSQL tables created successfully")
+            with self._conn() as connection, connection.cursor() as cursor:
+                cursor.execute(create_tweets_table)
+                cursor.execute(create_users_table)
+                cursor.execute(create_api_logs)
+                applied = self._migrate(cursor)
+                cursor.execute(create_tweets_indexes)
+                cursor.execute(create_stats_rollup)
+                
+                connection.commit()
+                self.applied_migrations.extend(applied)
+                if applied:
+                    logging.info(f"Applied schema migrations: {', '.join(applied)}")
+                logging.info("PostgreSQL tables created successfully")
             
         except Exception as e:
             logging.error(f"Error creating tables: {e}")
-        finally:
-            if connection:
-                cursor.close()
-                connection.close()
+
+    def migrate(self) -> List[str]:
+        """Apply pending schema migrations on their own connection, returns the keys applied"""
+        with self._conn() as connection, connection.cursor() as cursor:
+            applied = self._migrate(cursor)
+            connection.commit()
+        self.applied_migrations.extend(applied)
+        return applied
+
+    def _migrate(self, cursor) -> List[str]:
+        """Apply missing SCHEMA_MIGRATIONS in one batch, returns the keys applied"""
+        pending = self._pending_migrations(cursor)
+        if pending:
+            cursor.execute(";\n".join(ddl for _, ddl in pending))
+        return [key for key, _ in pending]
+
+    @staticmethod
+    def _pending_migrations(cursor) -> List[Tuple[str, str]]:
+        """Return the (key, ddl) SCHEMA_MIGRATIONS entries whose key is missing from the database"""
+        # One catalog round-trip covers every column, column type, NOT NULL column and unique constraint in the schema
+        cursor.execute("""
+        SELECT table_name || '.' || column_name FROM information_schema.columns
+        WHERE table_schema = current_schema()
+        UNION ALL
+        SELECT table_name || '.' || column_name || ':' || udt_name FROM information_schema.columns
+        WHERE table_schema = current_schema()
+        UNION ALL
+        SELECT table_name || '.' || column_name || ':not_null' FROM information_schema.columns
+        WHERE table_schema = current_schema() AND is_nullable = 'NO'
+        UNION ALL
+        SELECT table_name || '.' || constraint_name FROM information_schema.table_constraints
+        WHERE table_schema = current_schema() AND constraint_type = 'UNIQUE'
+        """)
+        present = {row[0] for row in cursor.fetchall()}
+        return [(key, ddl) for key, ddl in SCHEMA_MIGRATIONS if key not in present]
 
     def insert_tweet(self, tweet_data: Dict) -> bool:
-        """Insert classified tweet into database"""
-        insert_query = """
-        INSERT INTO tweets (tweet_id, text, username, user_followers, tweet_timestamp,
-                           classification_label, confidence_score, category, model_version,
-                           likes, retweets, replies, image_url)
-        VALUES (%(tweet_id)s, %(text)s, %(username)s, %(user_followers)s, %(tweet_timestamp)s,
-                %(classification_label)s, %(confidence_score)s, %(category)s, %(model_version)s,
-                %(likes)s, %(retweets)s, %(replies)s, %(image_url)s)
-        ON CONFLICT (tweet_id) DO UPDATE SET
-        classification_label = EXCLUDED.classification_label,
-        confidence_score = EXCLUDED.confidence_score,
-        category = EXCLUDED.category,
-        image_url = EXCLUDED.image_url,
-        processed_at = CURRENT_TIMESTAMP
+        """Insert classified tweet into database, True once it is committed"""
+        return self.insert_tweets_bulk([tweet_data]) == 1
+
+    def insert_tweets_bulk(self, tweets: List[Dict], batch_size: int = 500) -> int:
+        """Insert classified tweets in batches on a single connection, or through COPY for large loads, returns rows written"""
+        insert_query = TWEET_UPSERT_SQL.format(rows="VALUES %s")
+        row_template = """
+        (%(tweet_id)s, %(text)s, %(username)s, %(user_followers)s, %(tweet_timestamp)s,
+         %(classification_label)s, %(confidence_score)s, %(category)s, %(model_version)s,
+         %(likes)s, %(retweets)s, %(replies)s, %(image_url)s)
         """
+        if not tweets:
+            return 0
+        if len(tweets) >= TWEET_COPY_THRESHOLD:
+            return self.bulk_copy_tweets(tweets)
+
+        # A multi-row upsert may not touch the same tweet twice, keep the latest copy
+        tweets = list({tweet['tweet_id']: tweet for tweet in tweets}.values())
+
+        written = 0
+        try:
+            with self._conn() as connection, connection.cursor() as cursor:
+                # One multi-row INSERT and one commit per batch
+                for start in range(0, len(tweets), batch_size):
+                    batch = tweets[start:start + batch_size]
+                    execute_values(cursor, insert_query, batch, template=row_template, page_size=batch_size)
+                    connection.commit()
+                    self._stats_cache = None
+                    self._categories_cache = None
+                    written += len(batch)
+            return written
+            
+        except Exception as e:
+            logging.error(f"Error inserting tweets: {e}")
+            return written
+
+    def bulk_copy_tweets(self, tweets: Iterable[Dict], chunk_size: int = 10000) -> int:
+        """Load tweets through COPY into a staging table, then upsert them in one statement, returns rows copied"""
+        stage_columns = ', '.join(TWEET_COLUMNS)
+        # Later copies of a tweet were staged later, so the highest ctid per tweet_id wins
+        upsert_query = TWEET_UPSERT_SQL.format(rows=f"""
+        SELECT DISTINCT ON (tweet_id) {stage_columns}
+        FROM tweets_stage
+        ORDER BY tweet_id, ctid DESC
+        """)
         
-        connection = None
+        copied = 0
         try:
-            connection = self.get_connection()
-            cursor = connection.cursor()
-            cursor.execute(insert_query, tweet_data)
-            connection.commit()
-            return True
+            with self._conn() as connection, connection.cursor() as cursor:
+                # Only the copied columns: no id default, so staged rows draw nothing from tweets_id_seq
+                cursor.execute(f"CREATE TEMP TABLE tweets_stage ON COMMIT DROP AS SELECT {stage_columns} FROM tweets WITH NO DATA")
+                
+                # Stream the rows in chunks so a large replay never sits in memory as one buffer
+                rows = iter(tweets)
+                while True:
+                    chunk = list(islice(rows, chunk_size))
+                    if not chunk:
+                        break
+                    buffer = io.StringIO()
+                    for tweet in chunk:
+                        buffer.write('\t'.join(self._copy_value(tweet.get(column)) for column in TWEET_COLUMNS))
+                        buffer.write('\n')
+                    buffer.seek(0)
+                    cursor.copy_expert(f"COPY tweets_stage ({stage_columns}) FROM STDIN", buffer)
+                    copied += len(chunk)
+                
+                if copied:
+                    cursor.execute(upsert_query)
+                connection.commit()
+                self._stats_cache = None
+                self._categories_cache = None
+            return copied
             
         except Exception as e:
-            logging.error(f"Error inserting tweet: {e}")
-            return False
-        finally:
-            if connection:
-                cursor.close()
-                connection.close()
-
-    def get_verified_tweets(self, limit: int = 50, min_confidence: float = 0.6, category: str = None) -> List[Dict]:
-        """Get verified tweets from database"""
-        if category and category != 'all':
-            query = """
-            SELECT tweet_id, text, username, tweet_timestamp, classification_label,
-                   confidence_score, category, likes, retweets, replies, image_url, processed_at
-            FROM tweets 
-            WHERE classification_label = 'verified' 
-            AND confidence_score >= %s 
-            AND category = %s
-            AND is_active = TRUE
-            ORDER BY tweet_timestamp DESC 
-            LIMIT %s
-            """
-            return self._execute_select_query(query, (min_confidence, category, limit))
-        else:
-            query = """
-            SELECT tweet_id, text, username, tweet_timestamp, classification_label,
-                   confidence_score, category, likes, retweets, replies, image_url, processed_at
-            FROM tweets 
-            WHERE classification_label = 'verified' 
-            AND confidence_score >= %s 
-            AND is_active = TRUE
-            ORDER BY tweet_timestamp DESC 
-            LIMIT %s
-            """
-            return self._execute_select_query(query, (min_confidence, limit))
+            logging.error(f"Error copying tweets: {e}")
+            return 0
 
-    def get_rumor_tweets(self, limit: int = 50, min_confidence: float = 0.5, category: str = None) -> List[Dict]:
-        """Get rumor tweets from database"""
-        if category and category != 'all':
-            query = """
-            SELECT tweet_id, text, username, tweet_timestamp, classification_label,
-                   confidence_score, category, likes, retweets, replies, image_url, processed_at
-            FROM tweets 
-            WHERE classification_label = 'rumor' 
-            AND confidence_score >= %s 
-            AND category = %s
-            AND is_active = TRUE
-            ORDER BY tweet_timestamp DESC 
-            LIMIT %s
-            """
-            return self._execute_select_query(query, (min_confidence, category, limit))
-        else:
-            query = """
-            SELECT tweet_id, text, username, tweet_timestamp, classification_label,
-                   confidence_score, category, likes, retweets, replies, image_url, processed_at
-            FROM tweets 
-            WHERE classification_label = 'rumor' 
-            AND confidence_score >= %s 
-            AND is_active = TRUE
-            ORDER BY tweet_timestamp DESC 
-            LIMIT %s
-            """
-            return self._execute_select_query(query, (min_confidence, limit))
+    @staticmethod
+    def _copy_value(value) -> str:
+        """Render a value as a COPY text-format field"""
+        if value is None:
+            return '\\N'
+        return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+                .replace('\n', '\\n').replace('\r', '\\r'))
 
-    def get_all_tweets(self, limit: int = 100, category: str = None) -> List[Dict]:
-        """Get all tweets from database"""
-        if category and category != 'all':
-            query = """
-            SELECT tweet_id, text, username, tweet_timestamp, classification_label,
-                   confidence_score, category, likes, retweets, replies, image_url, processed_at
-            FROM tweets 
-            WHERE is_active = TRUE AND category = %s
-            ORDER BY tweet_timestamp DESC 
-            LIMIT %s
-            """
-            return self._execute_select_query(query, (category, limit))
-        else:
-            query = """
+    def _feed_query(self, label: Optional[str], limit: int, min_confidence: Optional[float] = None,
+                    category: Optional[str] = None,
+                    before: Optional[Tuple[datetime, str]] = None) -> Tuple[str, tuple]:
+        """Return the feed SELECT and its params for the filters that are set"""
+        if category == 'all':
+            category = None
+        # Bind numeric literals so the planner sees a concrete LIMIT and confidence bound
+        limit = int(limit)
+        if min_confidence is not None:
+            min_confidence = float(min_confidence)
+
+        # Build each filter combination's SQL once and reuse the same text afterwards
+        flags = (label is not None, min_confidence is not None, category is not None, before is not None)
+        query = self._feed_queries.get(flags)
+        if query is None:
+            conditions = ["is_active = TRUE"]
+            if label is not None:
+                conditions.append("classification_label = %s")
+            if min_confidence is not None:
+                conditions.append("confidence_score >= %s")
+            if category is not None:
+                conditions.append("category = %s")
+            if before is not None:
+                # Keyset cursor: seek past the previous page's last (tweet_timestamp, tweet_id) instead of
+                # skipping rows; tweet_id breaks timestamp ties so rows sharing a timestamp are never lost
+                conditions.append("(tweet_timestamp, tweet_id) < (%s, %s)")
+            query = f"""
             SELECT tweet_id, text, username, tweet_timestamp, classification_label,
                    confidence_score, category, likes, retweets, replies, image_url, processed_at
             FROM tweets 
-            WHERE is_active = TRUE
-            ORDER BY tweet_timestamp DESC 
+            WHERE {' AND '.join(conditions)}
+            ORDER BY tweet_timestamp DESC, tweet_id DESC
             LIMIT %s
             """
-            return self._execute_select_query(query, (limit,))
+            self._feed_queries[flags] = query
+
+        params = tuple(value for value in (label, min_confidence, category) if value is not None)
+        if before is not None:
+            params += tuple(before)
+        return query, params + (limit,)
+
+    def get_feed_json(self, label: Optional[str], limit: int, min_confidence: Optional[float] = None,
+                      category: Optional[str] = None,
+                      before: Optional[Tuple[datetime, str]] = None) -> Tuple[str, Optional[str]]:
+        """Get a feed page as a ready-to-send JSON array of API posts, with a "tweet_timestamp|tweet_id" next cursor
+        naming its last row, or None when the page came back short and there is nothing after it"""
+        query, params = self._feed_query(label, limit, min_confidence, category, before)
+        # PostgreSQL builds the response body itself; ::text keeps psycopg2 from parsing the JSON back
+        json_query = f"""
+        SELECT COALESCE(json_agg(json_build_object(
+                   'id', tweet_id, 'text', text, 'author', username, 'created_at', tweet_timestamp,
+                   'label', classification_label, 'confidence', confidence_score::float8,
+                   'retweet_count', 0, 'like_count', likes, 'category', category, 'image_url', image_url
+               ) ORDER BY tweet_timestamp DESC, tweet_id DESC), '[]')::text,
+               (array_agg(tweet_timestamp ORDER BY tweet_timestamp, tweet_id))[1],
+               (array_agg(tweet_id ORDER BY tweet_timestamp, tweet_id))[1],
+               COUNT(*)
+        FROM ({query}) AS feed
+        """
+        rows = self._execute_rows(json_query, params, prepared=True)
+        if not rows:
+            return '[]', None
+        payload, timestamp, tweet_id, count = rows[0]
+        return payload, f"{timestamp}|{tweet_id}" if count == int(limit) else None
 
     def get_stats(self) -> Dict:
-        """Get classification statistics"""
+        """Get classification statistics for active tweets processed in the last 24 hours, cached for STATS_CACHE_SECONDS
+
+        Counts and averages follow each tweet's latest label, score and processed_at. The window is whole hours
+        from the rollup, and max/min confidence are bounds over every score recorded in it: a score that is
+        replaced or re-bucketed still widens them until its hour leaves the window.
+        """
+        cached = self._stats_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
         query = """
         SELECT 
             classification_label,
-            COUNT(*) as count,
-            AVG(confidence_score) as avg_confidence,
-            MAX(confidence_score) as max_confidence,
-            MIN(confidence_score) as min_confidence
-        FROM tweets 
-        WHERE processed_at >= NOW() - INTERVAL '24 hours'
-        AND is_active = TRUE
+            SUM(count) as count,
+            SUM(sum_confidence) / SUM(count) as avg_confidence,
+            MAX(max_confidence) as max_confidence,
+            MIN(min_confidence) as min_confidence
+        FROM tweet_stats_hourly 
+        WHERE hour_bucket >= date_trunc('hour', NOW() - INTERVAL '24 hours')
         GROUP BY classification_label
+        HAVING SUM(count) > 0
         """
         
-        results = self._execute_select_query(query)
+        results = self._execute_rows(query)
         stats = {}
-        for row in results:
-            stats[row['classification_label']] = {
-                'count': row['count'],
-                'avg_confidence': float(row['avg_confidence']),
-                'max_confidence': float(row['max_confidence']),
-                'min_confidence': float(row['min_confidence'])
+        for label, count, avg_confidence, max_confidence, min_confidence in results:
+            stats[label] = {
+                'count': count,
+                'avg_confidence': float(avg_confidence),
+                'max_confidence': float(max_confidence),
+                'min_confidence': float(min_confidence)
             }
+        # Failed reads come back empty and are not worth caching
+        if results:
+            self._stats_cache = (time.monotonic() + STATS_CACHE_SECONDS, stats)
         return stats
 
-    def _execute_select_query(self, query: str, params: tuple = None) -> List[Dict]:
+    def _prepare(self, cursor, query: str) -> str:
+        """PREPARE query once per pooled connection, returns the EXECUTE text taking the same params"""
+        statement = self._statements.get(query)
+        if statement is None:
+            placeholders = PLACEHOLDER_RE.findall(query)
+            positions = iter(range(1, len(placeholders) + 1))
+            name = "ds_" + hashlib.md5(query.encode()).hexdigest()[:16]
+            prepare_sql = f"PREPARE {name} AS {PLACEHOLDER_RE.sub(lambda _: f'${next(positions)}', query)}"
+            execute_sql = f"EXECUTE {name} ({', '.join(placeholders)})" if placeholders else f"EXECUTE {name}"
+            statement = self._statements[query] = (name, prepare_sql, execute_sql)
+
+        name, prepare_sql, execute_sql = statement
+        if name not in cursor.connection.prepared:
+            cursor.execute(prepare_sql)
+            cursor.connection.prepared.add(name)
+        return execute_sql
+
+    def _execute_select_query(self, query: str, params: tuple = None, prepared: bool = False) -> List[Dict]:
         """Execute SELECT query and return results as list of dictionaries"""
-        connection = None
+        description, results = self._fetchall(query, params, prepared)
+        return self._rows_to_dicts(description, results)
+
+    def _execute_rows(self, query: str, params: tuple = None, prepared: bool = False) -> List[tuple]:
+        """Execute SELECT query and return the plain result tuples, for callers that index columns by position"""
+        return self._fetchall(query, params, prepared)[1]
+
+    def _fetchall(self, query: str, params: tuple = None, prepared: bool = False) -> Tuple[tuple, List[tuple]]:
+        """Execute SELECT query and return the column description with all rows"""
         try:
-            connection = self.get_connection()
-            cursor = connection.cursor(cursor_factory=RealDictCursor)
+            with self._cursor() as cursor:
+                if prepared and self.use_prepared:
+                    query = self._prepare(cursor, query)
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                    
+                return cursor.description, cursor.fetchall()
             
-            if params:
+        except Exception as e:
+            logging.error(f"Error executing query: {e}")
+            return (), []
+
+    def _execute_fetchone(self, query: str, params: tuple = None, prepared: bool = False) -> Optional[Dict]:
+        """Execute SELECT query and return the first row as a dictionary, or None"""
+        try:
+            with self._cursor() as cursor:
+                if prepared and self.use_prepared:
+                    query = self._prepare(cursor, query)
                 cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-                
-            results = cursor.fetchall()
+                result = cursor.fetchone()
+                description = cursor.description
             
-            # Convert to regular dict and handle datetime serialization
-            formatted_results = []
-            for result in results:
-                row_dict = dict(result)
-                for key, value in row_dict.items():
-                    if isinstance(value, datetime):
-                        row_dict[key] = value.isoformat()
-                formatted_results.append(row_dict)
-                        
-            return formatted_results
+            return self._rows_to_dicts(description, [result])[0] if result is not None else None
             
         except Exception as e:
             logging.error(f"Error executing query: {e}")
-            return []
-        finally:
-            if connection:
-                cursor.close()
-                connection.close()
+            return None
+
+    @staticmethod
+    def _rows_to_dicts(description, rows) -> List[Dict]:
+        """Build dicts from tuple rows"""
+        columns = [column.name for column in description]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def get_categories(self) -> List[str]:
+        """Get distinct categories of active tweets in sorted order, cached for CATEGORIES_CACHE_SECONDS"""
+        cached = self._categories_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        # Loose index scan: each step seeks idx_tweets_feed_active (is_active, category, ...) to the next category,
+        # so the cost follows the handful of categories rather than the number of tweets
+        query = """
+        WITH RECURSIVE categories AS (
+            (SELECT category FROM tweets WHERE is_active = TRUE ORDER BY category LIMIT 1)
+            UNION ALL
+            SELECT (
+                SELECT category FROM tweets
+                WHERE is_active = TRUE AND category > categories.category
+                ORDER BY category LIMIT 1
+            )
+            FROM categories
+            WHERE categories.category IS NOT NULL
+        )
+        SELECT category FROM categories WHERE category IS NOT NULL
+        """
+        categories = [category for category, in self._execute_rows(query)]
+        # Failed reads come back empty and are not worth caching
+        if categories:
+            self._categories_cache = (time.monotonic() + CATEGORIES_CACHE_SECONDS, categories)
+        return categories
+
+    def get_last_processed_at(self) -> Optional[str]:
+        """Get when the most recent active tweet was written, None if there are none; database errors are raised"""
+        # Read backwards off idx_tweets_processed_at, stopping at the first active row.
+        # Unlike _execute_rows this does not swallow errors, so "no tweets" and "database down" stay distinct
+        with self._cursor() as cursor:
+            cursor.execute("SELECT MAX(processed_at) FROM tweets WHERE is_active = TRUE")
+            return cursor.fetchone()[0]
+
+    def clear_tweets(self):
+        """Delete all tweets"""
+        with self._conn() as connection, connection.cursor() as cursor:
+            cursor.execute("DELETE FROM tweets")
+            cursor.execute("DELETE FROM tweet_stats_hourly")
+            connection.commit()
+        self._stats_cache = None
+        self._categories_cache = None
+
+    def prune_tweets(self, batch_size: int = 5000) -> int:
+        """Delete tweets and rollup buckets older than the retention window in short batches, returns tweets deleted"""
+        if self.retention_days <= 0:
+            return 0
+        
+        # Batches are picked through the processed_at index and committed one by one to keep locks short
+        delete_query = """
+        DELETE FROM tweets WHERE id IN (
+            SELECT id FROM tweets
+            WHERE processed_at < NOW() - make_interval(days => %s)
+            LIMIT %s
+        )
+        """
+        deleted = 0
+        try:
+            with self._conn() as connection, connection.cursor() as cursor:
+                while True:
+                    cursor.execute(delete_query, (self.retention_days, batch_size))
+                    connection.commit()
+                    deleted += cursor.rowcount
+                    if cursor.rowcount < batch_size:
+                        break
+                cursor.execute(
+                    "DELETE FROM tweet_stats_hourly WHERE hour_bucket < NOW() - make_interval(days => %s)",
+                    (self.retention_days,)
+                )
+                connection.commit()
+                buckets_deleted = cursor.rowcount
+            if deleted or buckets_deleted:
+                self._stats_cache = None
+                self._categories_cache = None
+            return deleted
+            
+        except Exception as e:
+            logging.error(f"Error pruning tweets: {e}")
+            return deleted
 
     def log_api_request(self, endpoint: str):
-        """Log API request for analytics"""
+        """Count API request for analytics, written out by flush_api_logs"""
+        with self._api_counter_lock:
+            self._api_counter[endpoint] += 1
+            if self._api_counter.total() < API_LOG_FLUSH_EVENTS:
+                if self._api_flush_timer is None:
+                    self._api_flush_timer = threading.Timer(API_LOG_FLUSH_SECONDS, self.flush_api_logs)
+                    self._api_flush_timer.daemon = True
+                    self._api_flush_timer.start()
+                return
+        
+        self.flush_api_logs()
+
+    def flush_api_logs(self):
+        """Write buffered API request counts to api_logs in one statement"""
+        with self._api_counter_lock:
+            counts = self._api_counter
+            self._api_counter = Counter()
+            if self._api_flush_timer is not None:
+                self._api_flush_timer.cancel()
+                self._api_flush_timer = None
+        
+        if not counts:
+            return
+        
         query = """
         INSERT INTO api_logs (endpoint, request_count, last_accessed)
-        VALUES (%s, 1, NOW())
+        VALUES %s
         ON CONFLICT (endpoint) DO UPDATE SET
-        request_count = api_logs.request_count + 1,
+        request_count = api_logs.request_count + EXCLUDED.request_count,
         last_accessed = NOW()
         """
         
-        connection = None
         try:
-            connection = self.get_connection()
-            cursor = connection.cursor()
-            cursor.execute(query, (endpoint,))
-            connection.commit()
+            with self._conn() as connection, connection.cursor() as cursor:
+                execute_values(cursor, query, list(counts.items()), template="(%s, %s, NOW())")
+                connection.commit()
             
         except Exception as e:
             logging.error(f"Error logging API request: {e}")
-        finally:
-            if connection:
-                cursor.close()
-                connection.close()
 
     # Authentication Methods
-    def create_user(self, username: str, email: str, password_hash: str, full_name: str = None) -> bool:
-        """Create a new user"""
+    def create_user(self, username: str, email: str, password_hash: str, full_name: str = None) -> Optional[Dict]:
+        """Create a new user already signed in, returns the user or None if the username or email is taken"""
+        # last_login is stamped by the INSERT itself, so signup plus first login is one statement and one commit
         insert_query = """
-        INSERT INTO users (username, email, password_hash, full_name)
-        VALUES (%s, %s, %s, %s)
+        INSERT INTO users (username, email, password_hash, full_name, last_login)
+        VALUES (%s, %s, %s, %s, NOW())
+        ON CONFLICT DO NOTHING
+        RETURNING id, username, email, full_name, created_at, last_login
         """
         
-        connection = None
         try:
-            connection = self.get_connection()
-            cursor = connection.cursor()
-            cursor.execute(insert_query, (username, email, password_hash, full_name))
-            connection.commit()
-            return True
+            with self._conn() as connection, connection.cursor() as cursor:
+                cursor.execute(insert_query, (username, email, password_hash, full_name))
+                row = cursor.fetchone()
+                description = cursor.description
+                connection.commit()
+            return self._rows_to_dicts(description, [row])[0] if row is not None else None
             
         except Exception as e:
             logging.error(f"Error creating user: {e}")
-            return False
-        finally:
-            if connection:
-                cursor.close()
-                connection.close()
+            return None
 
     def get_user_by_username(self, username: str) -> Optional[Dict]:
         """Get user by username"""
@@ -324,10 +832,10 @@ class PostgreSQLDatabase:
         SELECT id, username, email, password_hash, full_name, created_at, last_login, is_active
         FROM users 
         WHERE username = %s AND is_active = TRUE
+        LIMIT 1
         """
         
-        results = self._execute_select_query(query, (username,))
-        return results[0] if results else None
+        return self._cached_user('username', username, query)
 
     def get_user_by_email(self, email: str) -> Optional[Dict]:
         """Get user by email"""
@@ -335,10 +843,28 @@ class PostgreSQLDatabase:
         SELECT id, username, email, password_hash, full_name, created_at, last_login, is_active
         FROM users 
         WHERE email = %s AND is_active = TRUE
+        LIMIT 1
         """
         
-        results = self._execute_select_query(query, (email,))
-        return results[0] if results else None
+        return self._cached_user('email', email, query)
+
+    def _cached_user(self, column: str, value: str, query: str) -> Optional[Dict]:
+        """Serve a user lookup from the in-process cache, querying and caching it on a miss"""
+        key = (column, value)
+        now = time.monotonic()
+        cached = self._user_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return dict(cached[1])
+        
+        user = self._execute_fetchone(query, (value,), prepared=True)
+        # Unknown users are not cached so a fresh signup is visible immediately
+        if user is not None:
+            with self._user_cache_lock:
+                if len(self._user_cache) >= USER_CACHE_SIZE:
+                    self._user_cache.clear()
+                self._user_cache[key] = (now + USER_CACHE_SECONDS, user)
+            return dict(user)
+        return None
 
     def update_last_login(self, user_id: int) -> bool:
         """Update user's last login timestamp"""
@@ -348,33 +874,65 @@ class PostgreSQLDatabase:
         WHERE id = %s
         """
         
-        connection = None
         try:
-            connection = self.get_connection()
-            cursor = connection.cursor()
-            cursor.execute(update_query, (user_id,))
-            connection.commit()
+            with self._conn() as connection, connection.cursor() as cursor:
+                cursor.execute(update_query, (user_id,))
+                connection.commit()
+            self._forget_user(user_id)
             return True
             
         except Exception as e:
             logging.error(f"Error updating last login: {e}")
             return False
-        finally:
-            if connection:
-                cursor.close()
-                connection.close()
+
+    def update_password_hash(self, user_id: int, password_hash: str) -> bool:
+        """Replace a user's stored password hash"""
+        update_query = """
+        UPDATE users 
+        SET password_hash = %s, updated_at = NOW() 
+        WHERE id = %s
+        """
+        
+        try:
+            with self._conn() as connection, connection.cursor() as cursor:
+                cursor.execute(update_query, (password_hash, user_id))
+                connection.commit()
+            self._forget_user(user_id)
+            return True
+            
+        except Exception as e:
+            logging.error(f"Error updating password hash: {e}")
+            return False
+
+    def _forget_user(self, user_id: int):
+        """Drop cached lookups of a user whose row just changed"""
+        with self._user_cache_lock:
+            self._user_cache = {key: entry for key, entry in self._user_cache.items() if entry[1]['id'] != user_id}
 
     def check_username_exists(self, username: str) -> bool:
         """Check if username already exists"""
-        query = "SELECT COUNT(*) as count FROM users WHERE username = %s"
-        results = self._execute_select_query(query, (username,))
-        return results[0]['count'] > 0 if results else False
+        query = "SELECT EXISTS (SELECT 1 FROM users WHERE username = %s)"
+        return self._execute_exists(query, (username,))
 
     def check_email_exists(self, email: str) -> bool:
         """Check if email already exists"""
-        query = "SELECT COUNT(*) as count FROM users WHERE email = %s"
-        results = self._execute_select_query(query, (email,))
-        return results[0]['count'] > 0 if results else False
+        query = "SELECT EXISTS (SELECT 1 FROM users WHERE email = %s)"
+        return self._execute_exists(query, (email,))
+
+    def _execute_exists(self, query: str, params: tuple) -> bool:
+        """Run a prepared SELECT EXISTS (...) and return its flag, False if the query failed"""
+        rows = self._execute_rows(query, params, prepared=True)
+        return bool(rows) and rows[0][0]
+
+# Global database instance, created on first use so importing this module stays cheap
+_db = None
+_db_lock = threading.Lock()
 
-# Global database instance
-db = PostgreSQLDatabase()
\ No newline at end of file
+def get_db() -> PostgreSQLDatabase:
+    """Get the process-wide database instance, creating it on first call"""
+    global _db
+    if _db is None:
+        with _db_lock:
+            if _db is None:
+                _db = PostgreSQLDatabase()
+    return _db
\ No newline at end of file
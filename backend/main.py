@@ -1,21 +1,30 @@
-from fastapi import FastAPI, HTTPException, Query, Depends, status
+from fastapi import FastAPI, HTTPException, Query, Depends, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from anyio import to_thread
 from pydantic import BaseModel
 import joblib
 import numpy as np
 import praw
+import requests
+from requests.adapters import HTTPAdapter
 import os
+import mmap
 import re
+import random
 import asyncio
-from typing import List, Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import hmac
+import time
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
 import logging
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
-from database.postgres_setup import db
+from database.postgres_setup import get_db
 import bcrypt
 import jwt
-from passlib.context import CryptContext
 
 # Load environment variables
 load_dotenv()
@@ -64,18 +73,71 @@ class User(BaseModel):
 
 app = FastAPI(title="Disaster Shield API - Reddit Edition", version="1.0.0")
 
+# bcrypt work factor for new password hashes
+PASSWORD_HASH_ROUNDS = 10
+
 # Simple authentication functions
+def hash_password(password: str) -> str:
+    """Hash a password with bcrypt for storage"""
+    # bcrypt only reads the first 72 bytes and refuses longer input
+    return bcrypt.hashpw(password.encode()[:72], bcrypt.gensalt(PASSWORD_HASH_ROUNDS)).decode()
+
+# Shape of a stored bcrypt hash; anything else is a plain-text password from before hashing
+BCRYPT_HASH_PATTERN = re.compile(r"\$2[abxy]?\$\d{2}\$[./A-Za-z0-9]{53}")
+
+def is_password_hash(password_hash: str) -> bool:
+    """Check whether a stored password is a bcrypt hash rather than legacy plain text"""
+    return BCRYPT_HASH_PATTERN.fullmatch(password_hash) is not None
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """Check a password against its bcrypt hash, or the plain text stored by older signups"""
+    if is_password_hash(password_hash):
+        try:
+            return bcrypt.checkpw(password.encode()[:72], password_hash.encode())
+        except ValueError:
+            # bcrypt still rejected it, so compare it as legacy plain text rather than failing the login
+            pass
+    return hmac.compare_digest(password.encode(), password_hash.encode())
+
+# Checked when the username is unknown, so a miss costs the same bcrypt work as a wrong password
+DUMMY_PASSWORD_HASH = hash_password(os.urandom(16).hex())
+
 def create_simple_token(username: str):
     """Create simple token"""
     return jwt.encode({"username": username}, SECRET_KEY, algorithm=ALGORITHM)
 
+# Verified tokens are remembered so repeat requests skip the HMAC check
+TOKEN_CACHE_SECONDS = 300
+TOKEN_CACHE_SIZE = 10000
+_token_cache = OrderedDict()
+_token_cache_lock = threading.Lock()
+
 def verify_simple_token(token: str):
     """Verify simple token"""
+    now = time.monotonic()
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+        if cached and now < cached[1]:
+            _token_cache.move_to_end(token)
+            return cached[0]
+    
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload.get("username")
     except:
         return None
+    
+    username = payload.get("username")
+    expires = now + TOKEN_CACHE_SECONDS
+    # Never keep a token past its own exp claim
+    if "exp" in payload:
+        expires = min(expires, now + payload["exp"] - time.time())
+    
+    with _token_cache_lock:
+        _token_cache[token] = (username, expires)
+        _token_cache.move_to_end(token)
+        if len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return username
 
 # Enable CORS for React Native
 app.add_middleware(
@@ -84,13 +146,25 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+# Worker threads for plain def endpoints (anyio defaults to 40)
+API_THREADPOOL_SIZE = int(os.getenv("API_THREADPOOL_SIZE", "200"))
+
+# Seconds clients and shared HTTP caches in front of the workers may reuse the near-static status responses
+PUBLIC_CACHE_SECONDS = 30
+PUBLIC_CACHE_CONTROL = f"public, max-age={PUBLIC_CACHE_SECONDS}"
+
 # Models will be loaded on startup
-ensemble_model = None
+svm_model = None
 vectorizer = None
 distilbert_model = None
 
+# (svm_model, vectorizer, result) of the /model-status test classification, redone only when the models change
+MODEL_PROBE_TEXT = "Breaking: Official earthquake alert issued by USGS"
+model_probe = None
+
 # Background task for automatic updates
 background_task = None
 
@@ -99,7 +173,11 @@ async def hourly_update_task():
     while True:
         try:
             logging.info("⏰ Starting hourly Reddit data update...")
-            await fetch_and_classify_reddit_posts()
+            await run_reddit_update()
+            # Batched DELETEs can take a while on a large table, so they run off the event loop
+            pruned = await asyncio.to_thread(get_db().prune_tweets)
+            if pruned:
+                logging.info(f"🧹 Pruned {pruned} tweets past the retention window")
             logging.info("✅ Hourly update completed successfully")
         except Exception as e:
             logging.error(f"❌ Error in hourly update: {e}")
@@ -107,66 +185,62 @@ async def hourly_update_task():
         # Wait for 1 hour (3600 seconds)
         await asyncio.sleep(3600)
 
+# Try different model paths for different environments
+SVM_MODEL_PATHS = [
+    "models/LinearSVM.joblib",      # Local to backend directory
+    "./models/LinearSVM.joblib",    # Alternative local path
+    "../models/LinearSVM.joblib"    # Fallback to root models
+]
+VECTORIZER_PATHS = [
+    "models/tfidf_vectorizer.joblib",      # Local to backend directory
+    "./models/tfidf_vectorizer.joblib",    # Alternative local path
+    "../models/tfidf_vectorizer.joblib"    # Fallback to root models
+]
+
+def prefetch_file(path: str):
+    """Fault a file into the page cache in one pass so the unpickler reads from memory"""
+    populate = getattr(mmap, "MAP_POPULATE", 0)  # Linux only
+    if not populate or not os.path.getsize(path):
+        return
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, flags=mmap.MAP_SHARED | populate, prot=mmap.PROT_READ):
+        pass
+
+def load_first_joblib(paths: List[str], name: str):
+    """Load the first of paths that joblib can read, None if none can"""
+    for path in paths:
+        try:
+            prefetch_file(path)
+            loaded = joblib.load(path)
+            logging.info(f"✅ {name} loaded from: {path}")
+            return loaded
+        except:
+            continue
+    return None
+
 @app.on_event("startup")
 async def startup_tasks():
-    global ensemble_model, vectorizer, distilbert_model, background_task
+    global svm_model, vectorizer, distilbert_model, background_task, model_probe
     try:
-        # Run database migration for image_url column
-        try:
-            from add_image_column import add_image_column
-            add_image_column()
-        except Exception as migration_error:
-            logging.warning(f"Migration skipped or already applied: {migration_error}")
-        
+        # Plain def handlers run on anyio's worker threads; DB calls beyond the pool sizes wait for a connection
+        to_thread.current_default_thread_limiter().total_tokens = API_THREADPOOL_SIZE
 
-        # Try to load SVM model and vectorizer (compatible pair)
-        try:
-            # Try different model paths for different environments
-            model_paths = [
-                "models/LinearSVM.joblib",      # Local to backend directory
-                "./models/LinearSVM.joblib",    # Alternative local path
-                "../models/LinearSVM.joblib"    # Fallback to root models
-            ]
-            
-            vectorizer_paths = [
-                "models/tfidf_vectorizer.joblib",      # Local to backend directory
-                "./models/tfidf_vectorizer.joblib",    # Alternative local path
-                "../models/tfidf_vectorizer.joblib"    # Fallback to root models
-            ]
-            
-            ensemble_model = None
-            vectorizer = None
-            
-            # Try to load SVM model
-            for path in model_paths:
-                try:
-                    ensemble_model = joblib.load(path)
-                    logging.info(f"✅ SVM Model loaded from: {path}")
-                    break
-                except:
-                    continue
-            
-            # Try to load vectorizer
-            for path in vectorizer_paths:
-                try:
-                    vectorizer = joblib.load(path)
-                    logging.info(f"✅ Vectorizer loaded from: {path}")
-                    break
-                except:
-                    continue
-            
-            if ensemble_model and vectorizer:
-                logging.info("✅ Both ML models loaded successfully")
-            else:
-                raise Exception("Could not load required models")
-                
-        except Exception as model_error:
-            logging.warning(f"⚠️ Could not load ML models: {model_error}")
+        # Load the SVM model and vectorizer (compatible pair) in worker threads while the
+        # database connects and runs table creation/migrations, rather than on the first request
+        svm_model, vectorizer, _ = await asyncio.gather(
+            asyncio.to_thread(load_first_joblib, SVM_MODEL_PATHS, "SVM Model"),
+            asyncio.to_thread(load_first_joblib, VECTORIZER_PATHS, "Vectorizer"),
+            asyncio.to_thread(get_db),
+        )
+        
+        if svm_model and vectorizer:
+            logging.info("✅ Both ML models loaded successfully")
+            model_probe = (svm_model, vectorizer, await asyncio.to_thread(classify_text, MODEL_PROBE_TEXT))
+        else:
+            logging.warning("⚠️ Could not load ML models: Could not load required models")
             logging.info("🔄 Using keyword-based classification")
         
         # Test Reddit API
-        reddit = setup_reddit_api()
-        if reddit:
+        if reddit_credentials_configured():
             logging.info("✅ Reddit API ready")
         else:
             logging.error("❌ Reddit API setup failed")
@@ -190,88 +264,30 @@ async def shutdown_tasks():
     if background_task:
         background_task.cancel()
         logging.info("⏰ Stopped hourly update task")
+    get_db().flush_api_logs()
 
-def clean_reddit_text(title: str, selftext: str = "") -> str:
-    """Clean and format Reddit post text for better readability"""
-    try:
-        # Start with the title
-        cleaned_text = title.strip()
-        
-        # Remove all emojis and symbols
-        cleaned_text = re.sub(r'[🌎🌏🌍🌄🌖🔥⚡🌊❄️🌪️🌀🌋⛈️🌩️🌨️🌦️🌤️⛅☀️🌞🌝🌛🌜🌚🌕🌖🌗🌘🌑🌒🌓🌔]', '', cleaned_text)
-        
-        # Remove markdown formatting
-        cleaned_text = re.sub(r'\*\*([^*]+)\*\*', r'\1', cleaned_text)  # Bold
-        cleaned_text = re.sub(r'\*([^*]+)\*', r'\1', cleaned_text)  # Italic
-        cleaned_text = re.sub(r'__([^_]+)__', r'\1', cleaned_text)  # Bold underscore
-        cleaned_text = re.sub(r'_([^_]+)_', r'\1', cleaned_text)  # Italic underscore
-        
-        # Remove technical earthquake/disaster data
-        cleaned_text = re.sub(r'\([0-9.]+\s*M[a-z]*[,\s]*at\s*[0-9:]+\s*UTC\)', '', cleaned_text)
-        cleaned_text = re.sub(r'registered by [A-Z,\s]+', '', cleaned_text)
-        cleaned_text = re.sub(r'[0-9]{4}-[0-9]{2}-[0-9]{2}[\sT][0-9:]+[\sZ]*UTC?', '', cleaned_text)
-        cleaned_text = re.sub(r'likely felt \d+[,\d]* km away', '', cleaned_text)
-        cleaned_text = re.sub(r'by \d+[,\d]* people', '', cleaned_text)
-        
-        # Remove website references and technical info
-        cleaned_text = re.sub(r'\([^)]*localhost[^)]*\)', '', cleaned_text)
-        cleaned_text = re.sub(r'\([^)]*www\.[^)]*\)', '', cleaned_text)
-        cleaned_text = re.sub(r'\([^)]*\.gov[^)]*\)', '', cleaned_text)
-        cleaned_text = re.sub(r'\([^)]*\.org[^)]*\)', '', cleaned_text)
-        
-        # Remove arrows, symbols, and technical markers
-        cleaned_text = re.sub(r'[>→←↑↓►◄▲▼]+', '', cleaned_text)
-        cleaned_text = re.sub(r'[\^]+[0-9-:TZ\s]+', '', cleaned_text)
-        cleaned_text = re.sub(r'Â±\s*\d+\s*km', '', cleaned_text)
-        cleaned_text = re.sub(r'â\d+\s*km', '', cleaned_text)
-        cleaned_text = re.sub(r'±\s*\d+\s*km', '', cleaned_text)
-        
-        # Remove location coordinates and technical details
-        cleaned_text = re.sub(r'\([0-9.-]+,\s*[0-9.-]+\)', '', cleaned_text)
-        cleaned_text = re.sub(r'\*[^*]*\*', '', cleaned_text)  # Remove remaining asterisk content
-        
-        # Clean up location prefixes
-        cleaned_text = re.sub(r'^[A-Za-z\s]+:', '', cleaned_text).strip()
-        
-        # Add meaningful selftext if available
-        if selftext and len(selftext.strip()) > 30:
-            clean_selftext = selftext.strip()
-            # Remove URLs and markdown
-            clean_selftext = re.sub(r'https?://[^\s]+', '', clean_selftext)
-            clean_selftext = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', clean_selftext)
-            clean_selftext = re.sub(r'\*\*([^*]+)\*\*', r'\1', clean_selftext)
-            
-            # Only add if it's meaningful content
-            if (len(clean_selftext) > 50 and 
-                not clean_selftext.lower().startswith(('full description', 'source:', 'link:', 'http'))):
-                cleaned_text += f" {clean_selftext[:300]}"
-        
-        # Final cleanup
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text)  # Multiple spaces to single
-        cleaned_text = re.sub(r'[.]{2,}', '.', cleaned_text)  # Multiple dots to single
-        cleaned_text = re.sub(r'[,]{2,}', ',', cleaned_text)  # Multiple commas to single
-        cleaned_text = cleaned_text.strip(' .,!-:;')  # Remove trailing punctuation
-        
-        # Ensure proper sentence ending
-        if cleaned_text and not cleaned_text.endswith(('.', '!', '?')):
-            cleaned_text += '.'
-            
-        # Capitalize first letter
-        if cleaned_text:
-            cleaned_text = cleaned_text[0].upper() + cleaned_text[1:]
-            
-        return cleaned_text
-        
-    except Exception as e:
-        logging.error(f"Error cleaning text: {e}")
-        return title  # Return original title if cleaning fails
+# Subreddits fetched at once; keeps bursts under Reddit's rate limit
+REDDIT_FETCH_CONCURRENCY = 4
+
+# One keep-alive pool shared by every PRAW client, capped at one connection per concurrent fetch
+REDDIT_HTTP_SESSION = requests.Session()
+REDDIT_HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=REDDIT_FETCH_CONCURRENCY))
+
+# Subreddit fetches run on these threads; PRAW clients are not thread-safe, so each thread keeps its own
+# client in REDDIT_CLIENTS and reuses its OAuth token across fetches instead of authorizing per subreddit
+REDDIT_EXECUTOR = ThreadPoolExecutor(max_workers=REDDIT_FETCH_CONCURRENCY, thread_name_prefix="reddit")
+REDDIT_CLIENTS = threading.local()
+
+REDDIT_CREDENTIAL_VARS = ("REDDIT_CLIENT_ID", "REDDIT_CLIENT_SECRET", "REDDIT_USER_AGENT")
+
+def reddit_credentials_configured() -> bool:
+    """Check the Reddit API credentials are set, without building a client"""
+    return all(os.getenv(name) for name in REDDIT_CREDENTIAL_VARS)
 
 def setup_reddit_api():
     """Setup Reddit API client with proper credentials"""
     try:
-        client_id = os.getenv("REDDIT_CLIENT_ID")
-        client_secret = os.getenv("REDDIT_CLIENT_SECRET")
-        user_agent = os.getenv("REDDIT_USER_AGENT")
+        client_id, client_secret, user_agent = (os.getenv(name) for name in REDDIT_CREDENTIAL_VARS)
         
         if not all([client_id, client_secret, user_agent]):
             logging.error("❌ Reddit API credentials missing in .env file")
@@ -281,7 +297,8 @@ def setup_reddit_api():
             client_id=client_id,
             client_secret=client_secret,
             user_agent=user_agent,
-            check_for_async=False
+            check_for_async=False,
+            requestor_kwargs={"session": REDDIT_HTTP_SESSION}
         )
         
         logging.info("✅ Reddit API client created successfully with credentials")
@@ -291,40 +308,43 @@ def setup_reddit_api():
         logging.error(f"❌ Reddit API setup failed: {e}")
         return None
 
+# Every emoji range is non-ASCII, so ASCII-only posts can skip this pattern
+EMOJI_PATTERN = re.compile(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251]+')
+
+# Substitutions clean_reddit_text applies in order, compiled once at import
+CLEAN_TEXT_SUBSTITUTIONS = [
+    # Remove URLs
+    (re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'), ''),
+    # Remove Reddit-specific formatting
+    (re.compile(r'\[([^\]]+)\]\([^)]+\)'), r'\1'),  # Remove markdown links
+    (re.compile(r'\*\*([^*]+)\*\*'), r'\1'),  # Remove bold formatting
+    (re.compile(r'\*([^*]+)\*'), r'\1'),  # Remove italic formatting
+    (re.compile(r'~~([^~]+)~~'), r'\1'),  # Remove strikethrough
+    (re.compile(r'`([^`]+)`'), r'\1'),  # Remove code formatting
+    # Remove excessive whitespace and newlines
+    (re.compile(r'\s+'), ' '),
+    # Remove emojis (basic emoji removal)
+    (EMOJI_PATTERN, ''),
+    # Remove timestamps and technical data
+    (re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}'), ''),  # ISO timestamps
+    (re.compile(r'\d{1,2}:\d{2}(:\d{2})?\s*(AM|PM|am|pm)'), ''),  # Time stamps
+    (re.compile(r'UTC|GMT|EST|PST|CST|MST'), ''),  # Timezone abbreviations
+    # Remove Reddit-specific prefixes and suffixes
+    (re.compile(r'^(UPDATE|EDIT|BREAKING|URGENT):\s*', re.IGNORECASE), ''),
+    (re.compile(r'\s*(x-post|crosspost|cross-post)\s*.*$', re.IGNORECASE), ''),
+]
+
 def clean_reddit_text(title: str, selftext: str = "") -> str:
     """Clean and format Reddit text for better readability"""
-    import re
-    
     # Combine title and selftext
     full_text = f"{title}"
     if selftext and selftext.strip():
         full_text += f" {selftext}"
     
-    # Remove URLs
-    full_text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', full_text)
-    
-    # Remove Reddit-specific formatting
-    full_text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', full_text)  # Remove markdown links
-    full_text = re.sub(r'\*\*([^*]+)\*\*', r'\1', full_text)  # Remove bold formatting
-    full_text = re.sub(r'\*([^*]+)\*', r'\1', full_text)  # Remove italic formatting
-    full_text = re.sub(r'~~([^~]+)~~', r'\1', full_text)  # Remove strikethrough
-    full_text = re.sub(r'`([^`]+)`', r'\1', full_text)  # Remove code formatting
-    
-    # Remove excessive whitespace and newlines
-    full_text = re.sub(r'\n+', ' ', full_text)
-    full_text = re.sub(r'\s+', ' ', full_text)
-    
-    # Remove emojis (basic emoji removal)
-    full_text = re.sub(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U000024C2-\U0001F251]+', '', full_text)
-    
-    # Remove timestamps and technical data
-    full_text = re.sub(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}', '', full_text)  # ISO timestamps
-    full_text = re.sub(r'\d{1,2}:\d{2}(:\d{2})?\s*(AM|PM|am|pm)', '', full_text)  # Time stamps
-    full_text = re.sub(r'UTC|GMT|EST|PST|CST|MST', '', full_text)  # Timezone abbreviations
-    
-    # Remove Reddit-specific prefixes and suffixes
-    full_text = re.sub(r'^(UPDATE|EDIT|BREAKING|URGENT):\s*', '', full_text, flags=re.IGNORECASE)
-    full_text = re.sub(r'\s*(x-post|crosspost|cross-post)\s*.*$', '', full_text, flags=re.IGNORECASE)
+    for pattern, replacement in CLEAN_TEXT_SUBSTITUTIONS:
+        if pattern is EMOJI_PATTERN and full_text.isascii():
+            continue
+        full_text = pattern.sub(replacement, full_text)
     
     # Clean up and return
     full_text = full_text.strip()
@@ -335,24 +355,48 @@ def clean_reddit_text(title: str, selftext: str = "") -> str:
     
     return full_text
 
+# Keyword tables for category detection and keyword classification, built once at import.
+# Plain substring checks run in C and beat a combined re alternation for lists this short.
+CATEGORY_KEYWORDS = {
+    'earthquake': ('earthquake', 'seismic', 'tremor', 'quake', 'magnitude', 'richter', 'epicenter'),
+    'flood': ('flood', 'flooding', 'deluge', 'inundation', 'overflow', 'dam burst', 'levee'),
+    'fire': ('wildfire', 'forest fire', 'bushfire', 'fire', 'blaze', 'inferno', 'burn'),
+    'storm': ('hurricane', 'typhoon', 'cyclone', 'tornado', 'storm', 'tempest', 'gale'),
+    'weather': ('heatwave', 'blizzard', 'drought', 'extreme weather', 'severe weather'),
+    'volcanic': ('volcano', 'volcanic', 'eruption', 'lava', 'ash cloud', 'magma'),
+    'landslide': ('landslide', 'mudslide', 'avalanche', 'rockslide', 'debris flow'),
+    'tsunami': ('tsunami', 'tidal wave', 'seismic wave')
+}
+
+# Verified news indicators
+VERIFIED_KEYWORDS = (
+    'official', 'usgs', 'confirmed', 'breaking', 'emergency services',
+    'authorities', 'government', 'fire department', 'police', 'fema',
+    'national weather service', 'earthquake', 'magnitude', 'evacuation',
+    'nws', 'noaa', 'red cross', 'emergency management', 'disaster response',
+    'first responders', 'rescue teams', 'meteorologist', 'seismologist',
+    'issued warning', 'alert issued', 'official statement', 'press release'
+)
+
+# Rumor/fake news indicators
+RUMOR_KEYWORDS = (
+    'fake', 'rumor', 'unconfirmed', 'allegedly', 'reports suggest',
+    'conspiracy', 'alien', 'fabricated', 'false information',
+    'hoax', 'misleading', 'debunked', 'unverified', 'speculation',
+    'claims without evidence', 'social media reports', 'viral video',
+    'end times', 'apocalypse', 'government cover-up'
+)
+
+OFFICIAL_SOURCES = ('official', 'government', 'emergency')
+NEWS_INDICATORS = ('breaking', 'reported', 'according to', 'sources say', 'confirmed')
+UNCERTAINTY_INDICATORS = ('might', 'could', 'possibly', 'allegedly', 'reportedly')
+
 def detect_disaster_category(text: str) -> str:
     """Detect the disaster category from text"""
     text_lower = text.lower()
     
-    # Category keywords
-    categories = {
-        'earthquake': ['earthquake', 'seismic', 'tremor', 'quake', 'magnitude', 'richter', 'epicenter'],
-        'flood': ['flood', 'flooding', 'deluge', 'inundation', 'overflow', 'dam burst', 'levee'],
-        'fire': ['wildfire', 'forest fire', 'bushfire', 'fire', 'blaze', 'inferno', 'burn'],
-        'storm': ['hurricane', 'typhoon', 'cyclone', 'tornado', 'storm', 'tempest', 'gale'],
-        'weather': ['heatwave', 'blizzard', 'drought', 'extreme weather', 'severe weather'],
-        'volcanic': ['volcano', 'volcanic', 'eruption', 'lava', 'ash cloud', 'magma'],
-        'landslide': ['landslide', 'mudslide', 'avalanche', 'rockslide', 'debris flow'],
-        'tsunami': ['tsunami', 'tidal wave', 'seismic wave']
-    }
-    
     # Check for category matches
-    for category, keywords in categories.items():
+    for category, keywords in CATEGORY_KEYWORDS.items():
         if any(keyword in text_lower for keyword in keywords):
             return category
     
@@ -360,102 +404,68 @@ def detect_disaster_category(text: str) -> str:
 
 def classify_text(text: str) -> Dict[str, float]:
     """Classify text using ensemble approach with fallback to keyword-based classification"""
-    global ensemble_model, vectorizer
+    return classify_texts([text])[0]
+
+def classify_texts(texts: List[str]) -> List[Dict[str, float]]:
+    """Classify a batch of texts with one SVM call, falling back to keyword-based classification"""
+    if not texts:
+        return []
     
     try:
-        # Try to use the SVM model directly (simpler approach)
-        if vectorizer is not None:
-            # Load and use the SVM model instead of the meta-ensemble
+        # Use the SVM model loaded at startup, vectorizing the whole batch at once
+        if vectorizer is not None and svm_model is not None:
             try:
-                import joblib
-                # Try different paths for SVM model
-                svm_paths = ["models/LinearSVM.joblib", "./models/LinearSVM.joblib", "../models/LinearSVM.joblib"]
-                svm_model = None
-                for path in svm_paths:
-                    try:
-                        svm_model = joblib.load(path)
-                        break
-                    except:
-                        continue
-                
-                if not svm_model:
-                    raise Exception("SVM model not found in any path")
-                
-                # Vectorize the text
-                text_vectorized = vectorizer.transform([text])
+                text_vectorized = vectorizer.transform(texts)
                 
-                # Get prediction and probability from SVM model
-                prediction = svm_model.predict(text_vectorized)[0]
-                probabilities = svm_model.predict_proba(text_vectorized)[0]
+                # Get predictions and probabilities from SVM model
+                predictions = svm_model.predict(text_vectorized)
+                probabilities = svm_model.predict_proba(text_vectorized)
                 
-                # Get confidence as the maximum probability
-                confidence = float(max(probabilities))
+                # Confidence is the maximum probability; map prediction to label (assuming 0=rumor, 1=verified)
+                results = [
+                    {"label": "verified" if prediction == 1 else "rumor", "confidence": float(max(row))}
+                    for prediction, row in zip(predictions, probabilities)
+                ]
                 
-                # Map prediction to label (assuming 0=rumor, 1=verified)
-                label = "verified" if prediction == 1 else "rumor"
-                
-                logging.info(f"SVM Classification: {label} (confidence: {confidence:.3f})")
-                return {"label": label, "confidence": confidence}
+                logging.info(f"SVM Classification: {len(results)} texts")
+                return results
                 
             except Exception as svm_error:
                 logging.error(f"SVM model error: {svm_error}")
                 # Fallback to keyword-based classification
-                return classify_text_keywords(text)
+                return [classify_text_keywords(text) for text in texts]
             
         else:
             # Fallback to keyword-based classification
-            logging.warning("Vectorizer not available, using keyword-based classification")
-            return classify_text_keywords(text)
+            logging.warning("SVM model not available, using keyword-based classification")
+            return [classify_text_keywords(text) for text in texts]
             
     except Exception as e:
         logging.error(f"Classification error: {e}, falling back to keywords")
-        return classify_text_keywords(text)
+        return [classify_text_keywords(text) for text in texts]
 
 def classify_text_keywords(text: str) -> Dict[str, float]:
     """Fallback keyword-based classification"""
     try:
         text_lower = text.lower()
         
-        # Verified news indicators
-        verified_keywords = [
-            'official', 'usgs', 'confirmed', 'breaking', 'emergency services',
-            'authorities', 'government', 'fire department', 'police', 'fema',
-            'national weather service', 'earthquake', 'magnitude', 'evacuation',
-            'nws', 'noaa', 'red cross', 'emergency management', 'disaster response',
-            'first responders', 'rescue teams', 'meteorologist', 'seismologist',
-            'issued warning', 'alert issued', 'official statement', 'press release'
-        ]
-        
-        # Rumor/fake news indicators  
-        rumor_keywords = [
-            'fake', 'rumor', 'unconfirmed', 'allegedly', 'reports suggest',
-            'conspiracy', 'alien', 'fabricated', 'false information',
-            'hoax', 'misleading', 'debunked', 'unverified', 'speculation',
-            'claims without evidence', 'social media reports', 'viral video',
-            'end times', 'apocalypse', 'government cover-up'
-        ]
-        
-        verified_score = sum(1 for keyword in verified_keywords if keyword in text_lower)
-        rumor_score = sum(1 for keyword in rumor_keywords if keyword in text_lower)
+        verified_score = sum(1 for keyword in VERIFIED_KEYWORDS if keyword in text_lower)
+        rumor_score = sum(1 for keyword in RUMOR_KEYWORDS if keyword in text_lower)
         
         total_matches = verified_score + rumor_score
         
         if total_matches == 0:
-            import random
-            
             # Check for official sources
-            if any(source in text_lower for source in ['official', 'government', 'emergency']):
+            if any(source in text_lower for source in OFFICIAL_SOURCES):
                 # Vary official source confidence
                 confidence = 0.70 + (random.random() * 0.20)  # 70-90% range
                 return {"label": "verified", "confidence": confidence}
             
             # Check for news-like indicators
-            news_indicators = ['breaking', 'reported', 'according to', 'sources say', 'confirmed']
-            news_score = sum(1 for indicator in news_indicators if indicator in text_lower)
+            news_score = sum(1 for indicator in NEWS_INDICATORS if indicator in text_lower)
             
             # Check for uncertainty indicators
-            uncertainty_indicators = ['might', 'could', 'possibly', 'allegedly', 'reportedly']
-            uncertainty_score = sum(1 for indicator in uncertainty_indicators if indicator in text_lower)
+            uncertainty_score = sum(1 for indicator in UNCERTAINTY_INDICATORS if indicator in text_lower)
             
             # Dynamic confidence based on content analysis
             if news_score > uncertainty_score:
@@ -486,7 +496,6 @@ def classify_text_keywords(text: str) -> Dict[str, float]:
             return {"label": "rumor", "confidence": confidence}
         else:
             # Random-ish confidence for neutral cases
-            import random
             confidence = 0.50 + (random.random() * 0.15)  # 50-65% range
             return {"label": "rumor", "confidence": confidence}
             
@@ -494,107 +503,146 @@ def classify_text_keywords(text: str) -> Dict[str, float]:
         logging.error(f"Keyword classification error: {e}")
         return {"label": "unknown", "confidence": 0.5}
 
+# Subreddits polled for disaster news, and the words a post must mention to be kept
+DISASTER_SUBREDDITS = (
+    'news', 'worldnews', 'weather', 'earthquakes',
+    'NaturalDisasters', 'naturesfury', 'Preparedness', 
+    'preppers', 'EmergencyManagement'
+)
+DISASTER_KEYWORDS = (
+    'earthquake', 'tsunami', 'flood', 'wildfire', 'hurricane', 'tornado', 
+    'emergency', 'evacuation', 'disaster', 'breaking', 'storm', 'cyclone',
+    'landslide', 'avalanche', 'drought', 'heatwave', 'blizzard', 'typhoon',
+    'volcanic', 'eruption', 'mudslide', 'sinkhole', 'severe weather',
+    'natural disaster', 'climate emergency', 'extreme weather'
+)
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif')
+
+# Hot posts read from each subreddit per fetch
+POSTS_PER_SUBREDDIT = 10
+
+def thread_reddit_client():
+    """Return the calling thread's Reddit client, creating it on first use"""
+    reddit = getattr(REDDIT_CLIENTS, "reddit", None)
+    if reddit is None:
+        reddit = REDDIT_CLIENTS.reddit = setup_reddit_api()
+    return reddit
+
+def fetch_subreddit_posts(subreddit_name: str) -> List[Dict]:
+    """Fetch disaster-related hot posts from one subreddit (blocking, run it on REDDIT_EXECUTOR)"""
+    posts = []
+    try:
+        reddit = thread_reddit_client()
+        if not reddit:
+            raise Exception("Reddit API not configured")
+        
+        logging.info(f"🔍 Searching subreddit: r/{subreddit_name}")
+        subreddit = reddit.subreddit(subreddit_name)
+        
+        # Get hot posts from the subreddit (reduced per subreddit due to more sources)
+        for post in subreddit.hot(limit=POSTS_PER_SUBREDDIT):
+            post_text = f"{post.title} {post.selftext}".lower()
+            
+            # Check if post contains disaster-related keywords
+            if any(keyword in post_text for keyword in DISASTER_KEYWORDS):
+                # Clean and format the text for better readability
+                cleaned_text = clean_reddit_text(post.title, post.selftext)
+                
+                # Skip if the cleaned text is too short or not meaningful
+                if len(cleaned_text.strip()) < 20:
+                    continue
+                
+                # Detect disaster category
+                category = detect_disaster_category(cleaned_text)
+                
+                # Extract image URL from Reddit post
+                # Read the listing fields directly: a missing attribute makes PRAW refetch the post
+                raw = vars(post)
+                preview = raw.get('preview')
+                thumbnail = raw.get('thumbnail')
+                url = raw.get('url')
+                image_url = None
+                try:
+                    if preview and 'images' in preview:
+                        # Get the highest resolution image
+                        image_url = preview['images'][0]['source']['url']
+                    elif thumbnail and thumbnail.startswith('http'):
+                        image_url = thumbnail
+                    elif url and url.endswith(IMAGE_EXTENSIONS):
+                        image_url = url
+                except:
+                    pass  # No image available
+                    
+                post_data = {
+                    "tweet_id": f"reddit_{post.id}",
+                    "text": cleaned_text,
+                    "username": f"u/{post.author.name}" if post.author else "u/deleted",
+                    "user_followers": 0,  # Reddit doesn't have followers
+                    "tweet_timestamp": datetime.fromtimestamp(post.created_utc).isoformat(),
+                    "likes": post.score,
+                    "retweets": 0,  # Reddit doesn't have retweets
+                    "replies": post.num_comments,
+                    "category": category,
+                    "image_url": image_url
+                }
+                posts.append(post_data)
+                
+        logging.info(f"✅ Found disaster-related posts in r/{subreddit_name}")
+        
+    except Exception as subreddit_error:
+        logging.error(f"❌ Error fetching from r/{subreddit_name}: {subreddit_error}")
+    
+    return posts
+
 async def fetch_and_classify_reddit_posts():
     """Fetch ONLY real posts from Reddit using PRAW API"""
     try:
-        reddit = setup_reddit_api()
-        if not reddit:
+        if not reddit_credentials_configured():
             logging.error("❌ Reddit API not available")
             raise Exception("Reddit API not configured")
         
         logging.info("🔍 Fetching real posts from Reddit using PRAW API...")
         
-        disaster_subreddits = [
-            'news', 'worldnews', 'weather', 'earthquakes',
-            'NaturalDisasters', 'naturesfury', 'Preparedness', 
-            'preppers', 'EmergencyManagement'
-        ]
-        disaster_keywords = [
-            'earthquake', 'tsunami', 'flood', 'wildfire', 'hurricane', 'tornado', 
-            'emergency', 'evacuation', 'disaster', 'breaking', 'storm', 'cyclone',
-            'landslide', 'avalanche', 'drought', 'heatwave', 'blizzard', 'typhoon',
-            'volcanic', 'eruption', 'mudslide', 'sinkhole', 'severe weather',
-            'natural disaster', 'climate emergency', 'extreme weather'
-        ]
-        
-        all_posts = []
-        
-        for subreddit_name in disaster_subreddits:
+        # PRAW blocks, so subreddits are fetched on REDDIT_EXECUTOR's threads, a few at a time
+        loop = asyncio.get_running_loop()
+        
+        async def fetch_limited(subreddit_name: str) -> List[Dict]:
             try:
-                logging.info(f"🔍 Searching subreddit: r/{subreddit_name}")
-                subreddit = reddit.subreddit(subreddit_name)
-                
-                # Get hot posts from the subreddit (reduced per subreddit due to more sources)
-                for post in subreddit.hot(limit=10):
-                    post_text = f"{post.title} {post.selftext}".lower()
-                    
-                    # Check if post contains disaster-related keywords
-                    if any(keyword in post_text for keyword in disaster_keywords):
-                        # Clean and format the text for better readability
-                        cleaned_text = clean_reddit_text(post.title, post.selftext)
-                        
-                        # Skip if the cleaned text is too short or not meaningful
-                        if len(cleaned_text.strip()) < 20:
-                            continue
-                        
-                        # Detect disaster category
-                        category = detect_disaster_category(cleaned_text)
-                        
-                        # Extract image URL from Reddit post
-                        image_url = None
-                        try:
-                            if hasattr(post, 'preview') and 'images' in post.preview:
-                                # Get the highest resolution image
-                                image_url = post.preview['images'][0]['source']['url']
-                            elif hasattr(post, 'thumbnail') and post.thumbnail and post.thumbnail.startswith('http'):
-                                image_url = post.thumbnail
-                            elif post.url and any(post.url.endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif']):
-                                image_url = post.url
-                        except:
-                            pass  # No image available
-                            
-                        post_data = {
-                            "tweet_id": f"reddit_{post.id}",
-                            "text": cleaned_text,
-                            "username": f"u/{post.author.name}" if post.author else "u/deleted",
-                            "user_followers": 0,  # Reddit doesn't have followers
-                            "tweet_timestamp": datetime.fromtimestamp(post.created_utc).isoformat(),
-                            "likes": post.score,
-                            "retweets": 0,  # Reddit doesn't have retweets
-                            "replies": post.num_comments,
-                            "category": category,
-                            "image_url": image_url
-                        }
-                        all_posts.append(post_data)
-                        
-                logging.info(f"✅ Found disaster-related posts in r/{subreddit_name}")
-                
+                return await loop.run_in_executor(REDDIT_EXECUTOR, fetch_subreddit_posts, subreddit_name)
             except Exception as subreddit_error:
                 logging.error(f"❌ Error fetching from r/{subreddit_name}: {subreddit_error}")
-                continue
-        
-        # Remove duplicates and classify posts
-        unique_posts = {post['tweet_id']: post for post in all_posts}.values()
+                return []
         
+        # Classify and store each subreddit's posts as it arrives, while the rest are still fetching
+        seen_ids = set()
         processed_count = 0
-        for post_data in unique_posts:
-            try:
-                classification = classify_text(post_data["text"])
-                
-                db_data = {
+        for fetched in asyncio.as_completed([fetch_limited(name) for name in DISASTER_SUBREDDITS]):
+            # Skip posts already seen in another subreddit
+            unique_posts = []
+            for post in await fetched:
+                if post['tweet_id'] in seen_ids:
+                    continue
+                seen_ids.add(post['tweet_id'])
+                unique_posts.append(post)
+            if not unique_posts:
+                continue
+            
+            # One vectorizer/SVM pass per subreddit instead of one per post
+            classifications = await asyncio.to_thread(classify_texts, [post_data["text"] for post_data in unique_posts])
+            
+            classified_posts = [
+                {
                     **post_data,
                     "classification_label": classification["label"],
                     "confidence_score": classification["confidence"],
                     "model_version": "v2.0"
                 }
-                
-                if db.insert_tweet(db_data):
-                    processed_count += 1
-                    
-            except Exception as post_error:
-                logging.error(f"❌ Error processing post: {post_error}")
-                continue
-            
+                for post_data, classification in zip(unique_posts, classifications)
+            ]
+
+            # Batched insert instead of one INSERT per post
+            processed_count += await asyncio.to_thread(get_db().insert_tweets_bulk, classified_posts)
+
         if processed_count == 0:
             logging.warning("⚠️ No posts were processed. Check Reddit connection.")
         else:
@@ -604,127 +652,125 @@ async def fetch_and_classify_reddit_posts():
         logging.error(f"❌ Error in fetch_and_classify_reddit_posts: {e}")
         raise Exception(f"Reddit integration failed: {e}")
 
+# Fetch currently running; update requests that arrive meanwhile wait on it instead of starting another
+reddit_update_task = None
+
+async def run_reddit_update():
+    """Run fetch_and_classify_reddit_posts, or join the run already in progress"""
+    global reddit_update_task
+    if reddit_update_task is None or reddit_update_task.done():
+        reddit_update_task = asyncio.create_task(fetch_and_classify_reddit_posts())
+    # Shielded so one caller going away does not cancel the run the others are waiting on
+    await asyncio.shield(reddit_update_task)
+
 @app.post("/initialize-data")
 async def initialize_data():
     """Fetch and classify REAL posts from Reddit ONLY"""
     try:
-        await fetch_and_classify_reddit_posts()
+        await run_reddit_update()
         return {"status": "success", "message": "Real Reddit data fetched and classified successfully"}
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"Reddit API error: {str(e)}")
 
 @app.post("/clear-database")
-async def clear_database():
+def clear_database():
     """Clear all posts from database"""
     try:
-        connection = db.get_connection()
-        cursor = connection.cursor()
-        cursor.execute("DELETE FROM tweets")
-        cursor.execute("DELETE FROM classification_details")
-        connection.commit()
-        cursor.close()
-        connection.close()
+        get_db().clear_tweets()
         
         return {"status": "success", "message": "Database cleared - ready for real Reddit data"}
     except Exception as e:
         return {"status": "error", "message": f"Failed to clear database: {str(e)}"}
 
-@app.get("/reddit/disaster-news")
-async def get_disaster_news(
+def feed_cursor(
+    before: Optional[str] = Query(None, description="X-Next-Cursor from the previous page")
+) -> Optional[Tuple[datetime, str]]:
+    """Split a "tweet_timestamp|tweet_id" feed cursor into the keyset the next page starts after"""
+    if before is None:
+        return None
+    timestamp, _, tweet_id = before.partition("|")
+    try:
+        return datetime.fromisoformat(timestamp), tweet_id
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Invalid cursor")
+
+@app.get("/reddit/disaster-news", response_model=List[RedditPost])
+def get_disaster_news(
     limit: int = Query(20, ge=1, le=100),
     min_confidence: float = Query(0.5, ge=0.0, le=1.0),
-    category: str = Query("all", description="Filter by disaster category")
-) -> List[RedditPost]:
+    category: str = Query("all", description="Filter by disaster category"),
+    before: Optional[Tuple[datetime, str]] = Depends(feed_cursor)
+):
     """Get all disaster-related posts from database"""
-    db.log_api_request("/reddit/disaster-news")
-    
-    tweets = db.get_all_tweets(limit, category if category != "all" else None)
+    get_db().log_api_request("/reddit/disaster-news")
     
-    if not tweets:
-        raise HTTPException(
-            status_code=503, 
-            detail="No data available. Please initialize Reddit data first."
-        )
+    # The JSON body is built by PostgreSQL and sent as-is, like the verified and rumor feeds
+    payload, next_cursor = get_db().get_feed_json(
+        None, limit, min_confidence, category if category != "all" else None, before
+    )
     
-    classified_posts = []
-    for tweet in tweets:
-        if tweet['confidence_score'] >= min_confidence:
-            classified_post = RedditPost(
-                id=tweet["tweet_id"],
-                text=tweet["text"],
-                author=tweet["username"],
-                created_at=tweet["tweet_timestamp"],
-                label=tweet["classification_label"],
-                confidence=float(tweet["confidence_score"]),
-                retweet_count=0,  # Remove retweet count for Reddit
-                like_count=tweet["likes"],
-                category=tweet.get("category", "general"),
-                image_url=tweet.get("image_url")
+    # An empty first page only means "not initialized" when there are no tweets at all,
+    # not when every tweet falls below min_confidence
+    if payload == "[]" and before is None:
+        try:
+            last_update = get_db().get_last_processed_at()
+        except Exception as e:
+            logging.error(f"Could not read last update time: {e}")
+            raise HTTPException(status_code=503, detail="Database unavailable")
+        if last_update is None:
+            raise HTTPException(
+                status_code=503, 
+                detail="No data available. Please initialize Reddit data first."
             )
-            classified_posts.append(classified_post)
     
-    return classified_posts
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 @app.get("/reddit/verified")
-async def get_verified_news(
+def get_verified_news(
     limit: int = Query(50, ge=1, le=100),
     min_confidence: float = Query(0.6, ge=0.0, le=1.0),
-    category: str = Query("all", description="Filter by disaster category")
+    category: str = Query("all", description="Filter by disaster category"),
+    before: Optional[Tuple[datetime, str]] = Depends(feed_cursor)
 ):
     """Get only verified disaster news from database"""
-    db.log_api_request("/reddit/verified")
+    get_db().log_api_request("/reddit/verified")
     
-    tweets = db.get_verified_tweets(limit, min_confidence, category if category != "all" else None)
+    # The JSON body is built by PostgreSQL and sent as-is, skipping per-row models and re-encoding
+    payload, next_cursor = get_db().get_feed_json(
+        "verified", limit, min_confidence, category if category != "all" else None, before
+    )
     
-    return [
-        RedditPost(
-            id=tweet["tweet_id"],
-            text=tweet["text"],
-            author=tweet["username"],
-            created_at=tweet["tweet_timestamp"],
-            label=tweet["classification_label"],
-            confidence=float(tweet["confidence_score"]),
-            retweet_count=0,  # Remove retweet count for Reddit
-            like_count=tweet["likes"],
-            category=tweet.get("category", "general"),
-            image_url=tweet.get("image_url")
-        )
-        for tweet in tweets
-    ]
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 @app.get("/reddit/rumors")
-async def get_rumors(
+def get_rumors(
     limit: int = Query(50, ge=1, le=100),
     min_confidence: float = Query(0.5, ge=0.0, le=1.0),
-    category: str = Query("all", description="Filter by disaster category")
+    category: str = Query("all", description="Filter by disaster category"),
+    before: Optional[Tuple[datetime, str]] = Depends(feed_cursor)
 ):
     """Get rumor/unverified disaster news from database"""
-    db.log_api_request("/reddit/rumors")
+    get_db().log_api_request("/reddit/rumors")
     
-    tweets = db.get_rumor_tweets(limit, min_confidence, category if category != "all" else None)
+    # The JSON body is built by PostgreSQL and sent as-is, skipping per-row models and re-encoding
+    payload, next_cursor = get_db().get_feed_json(
+        "rumor", limit, min_confidence, category if category != "all" else None, before
+    )
     
-    return [
-        RedditPost(
-            id=tweet["tweet_id"],
-            text=tweet["text"],
-            author=tweet["username"],
-            created_at=tweet["tweet_timestamp"],
-            label=tweet["classification_label"],
-            confidence=float(tweet["confidence_score"]),
-            retweet_count=0,  # Remove retweet count for Reddit
-            like_count=tweet["likes"],
-            category=tweet.get("category", "general"),
-            image_url=tweet.get("image_url")
-        )
-        for tweet in tweets
-    ]
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 @app.get("/stats/dashboard")
-async def get_dashboard_stats():
+def get_dashboard_stats(response: Response):
     """Get classification statistics for dashboard"""
-    db.log_api_request("/stats/dashboard")
+    get_db().log_api_request("/stats/dashboard")
     
-    stats = db.get_stats()
+    stats = get_db().get_stats()
+    # get_stats returns {} when the read fails, which is not worth caching
+    if stats:
+        response.headers["Cache-Control"] = PUBLIC_CACHE_CONTROL
     return {
         "stats": stats,
         "last_updated": datetime.now().isoformat(),
@@ -733,47 +779,68 @@ async def get_dashboard_stats():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    # Polled often, so the body is written out directly instead of going through JSON encoding
+    timestamp = datetime.now().isoformat()
+    return Response(content=f'{{"status":"healthy","timestamp":"{timestamp}"}}', media_type="application/json")
 
 # Simple Authentication Endpoints
 @app.post("/auth/signup")
-async def signup(user_data: UserSignup):
+def signup(user_data: UserSignup):
     """Simple user registration"""
     try:
-        # Check if username exists
-        if db.check_username_exists(user_data.username):
-            return {"status": "error", "message": "Username already exists"}
-        
-        # Store password as plain text (simple approach)
-        success = db.create_user(
+        user = get_db().create_user(
             username=user_data.username,
             email=user_data.email,
-            password_hash=user_data.password,  # Store as plain text
+            password_hash=hash_password(user_data.password),
             full_name=user_data.full_name
         )
         
-        if success:
-            return {"status": "success", "message": "User created successfully"}
-        else:
-            return {"status": "error", "message": "Failed to create user"}
+        # The new account is signed in straight away, sparing the client a separate login round-trip
+        if user:
+            return {
+                "status": "success",
+                "message": "User created successfully",
+                "access_token": create_simple_token(user["username"]),
+                "token_type": "bearer",
+                "user": {
+                    "id": user["id"],
+                    "username": user["username"],
+                    "email": user["email"],
+                    "full_name": user["full_name"]
+                }
+            }
+        
+        # Only a failed insert needs to find out which unique column collided
+        if get_db().check_username_exists(user_data.username):
+            raise HTTPException(status_code=409, detail="Username already exists")
+        if get_db().check_email_exists(user_data.email):
+            raise HTTPException(status_code=409, detail="Email already exists")
+        raise HTTPException(status_code=500, detail="Failed to create user")
             
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Signup error: {e}")
-        return {"status": "error", "message": "Signup failed"}
+        raise HTTPException(status_code=500, detail="Signup failed")
 
 @app.post("/auth/login")
-async def login(user_credentials: UserLogin):
+def login(user_credentials: UserLogin):
     """Simple user login"""
     try:
         # Get user from database
-        user = db.get_user_by_username(user_credentials.username)
+        user = get_db().get_user_by_username(user_credentials.username)
         
+        # Unknown users and wrong passwords get the same answer after the same bcrypt work,
+        # so usernames cannot be probed by response or by timing
         if not user:
-            return {"status": "error", "message": "User not found"}
+            verify_password(user_credentials.password, DUMMY_PASSWORD_HASH)
+            raise HTTPException(status_code=401, detail="Invalid credentials")
+        if not verify_password(user_credentials.password, user["password_hash"]):
+            raise HTTPException(status_code=401, detail="Invalid credentials")
         
-        # Simple password check (plain text)
-        if user["password_hash"] != user_credentials.password:
-            return {"status": "error", "message": "Wrong password"}
+        # Accounts created before hashing get their plain-text password replaced on first login
+        if not is_password_hash(user["password_hash"]):
+            get_db().update_password_hash(user["id"], hash_password(user_credentials.password))
         
         # Create simple token
         token = create_simple_token(user_credentials.username)
@@ -790,21 +857,23 @@ async def login(user_credentials: UserLogin):
             }
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Login error: {e}")
-        return {"status": "error", "message": "Login failed"}
+        raise HTTPException(status_code=500, detail="Login failed")
 
 @app.get("/auth/me")
-async def get_current_user_info(token: str = Query(...)):
+def get_current_user_info(token: str = Query(...)):
     """Get current user information"""
     try:
         username = verify_simple_token(token)
         if not username:
-            return {"status": "error", "message": "Invalid token"}
+            raise HTTPException(status_code=401, detail="Invalid token")
             
-        user = db.get_user_by_username(username)
+        user = get_db().get_user_by_username(username)
         if not user:
-            return {"status": "error", "message": "User not found"}
+            raise HTTPException(status_code=404, detail="User not found")
             
         return {
             "status": "success",
@@ -817,35 +886,62 @@ async def get_current_user_info(token: str = Query(...)):
             }
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Get user error: {e}")
-        return {"status": "error", "message": "Failed to get user info"}
+        raise HTTPException(status_code=500, detail="Failed to get user info")
+
+LOGOUT_BODY = b'{"status":"success","message":"Logged out successfully"}'
 
 @app.post("/auth/logout")
 async def logout():
     """Simple logout"""
-    return {"status": "success", "message": "Logged out successfully"}
+    return Response(content=LOGOUT_BODY, media_type="application/json")
+
+# Static parts of the /reddit-status and /categories responses, built once from the fetch settings
+REDDIT_API_ENDPOINTS = {
+    "manual_update": "POST /initialize-data",
+    "verified_news": "GET /reddit/verified", 
+    "rumors": "GET /reddit/rumors",
+    "all_news": "GET /reddit/disaster-news"
+}
+REDDIT_DATA_SOURCES = {
+    "subreddits": [f"r/{name}" for name in DISASTER_SUBREDDITS],
+    "keywords": list(DISASTER_KEYWORDS),
+    "posts_per_subreddit": POSTS_PER_SUBREDDIT,
+    "total_subreddits": len(DISASTER_SUBREDDITS),
+    "total_potential_posts": POSTS_PER_SUBREDDIT * len(DISASTER_SUBREDDITS)
+}
+CATEGORY_FILTERS = {
+    "all": "All Disasters",
+    "earthquake": "Earthquakes",
+    "flood": "Floods",
+    "fire": "Wildfires",
+    "storm": "Storms & Hurricanes",
+    "weather": "Extreme Weather",
+    "volcanic": "Volcanic Activity",
+    "landslide": "Landslides",
+    "tsunami": "Tsunamis",
+    "general": "General Disasters"
+}
 
 @app.get("/reddit-status")
-async def reddit_api_status():
+def reddit_api_status(response: Response):
     """Check Reddit API status and update schedule"""
     try:
-        reddit = setup_reddit_api()
-        if not reddit:
-            return {"status": "error", "message": "Reddit API client could not be created"}
+        if not reddit_credentials_configured():
+            return {"status": "error", "message": "Reddit API credentials are not configured"}
         
         # Get last update time from database
         try:
-            stats = db.get_stats()
-            last_update = "Never"
-            if stats:
-                # Get the most recent processed tweet timestamp
-                recent_tweets = db.get_all_tweets(1)
-                if recent_tweets:
-                    last_update = recent_tweets[0]['processed_at']
-        except:
+            last_update = get_db().get_last_processed_at() or "Never"
+        except Exception as e:
+            logging.warning(f"⚠️ Could not read last update time: {e}")
             last_update = "Unknown"
-        
+        else:
+            # Only a successful read is worth letting clients cache
+            response.headers["Cache-Control"] = PUBLIC_CACHE_CONTROL
         return {
             "status": "ready",
             "message": "Reddit API ready with hourly automatic updates",
@@ -855,28 +951,8 @@ async def reddit_api_status():
                 "next_update": "Automatic",
                 "background_task": "Running" if background_task and not background_task.done() else "Stopped"
             },
-            "api_endpoints": {
-                "manual_update": "POST /initialize-data",
-                "verified_news": "GET /reddit/verified", 
-                "rumors": "GET /reddit/rumors",
-                "all_news": "GET /reddit/disaster-news"
-            },
-            "data_sources": {
-                "subreddits": [
-                    "r/news", "r/worldnews", "r/weather", "r/earthquakes",
-                    "r/NaturalDisasters", "r/naturesfury", "r/Preparedness", 
-                    "r/preppers", "r/EmergencyManagement"
-                ],
-                "keywords": [
-                    "earthquake", "tsunami", "flood", "wildfire", "hurricane", "tornado", 
-                    "emergency", "evacuation", "disaster", "breaking", "storm", "cyclone",
-                    "landslide", "avalanche", "drought", "heatwave", "blizzard", "typhoon",
-                    "volcanic", "eruption", "mudslide", "sinkhole", "severe weather"
-                ],
-                "posts_per_subreddit": 10,
-                "total_subreddits": 9,
-                "total_potential_posts": 90
-            }
+            "api_endpoints": REDDIT_API_ENDPOINTS,
+            "data_sources": REDDIT_DATA_SOURCES
         }
         
     except Exception as e:
@@ -887,33 +963,18 @@ async def reddit_api_status():
         }
 
 @app.get("/categories")
-async def get_categories():
+def get_categories(response: Response):
     """Get available disaster categories"""
     try:
-        connection = db.get_connection()
-        cursor = connection.cursor()
-        
         # Get distinct categories from database
-        cursor.execute("SELECT DISTINCT category FROM tweets WHERE is_active = TRUE")
-        categories = [row[0] for row in cursor.fetchall()]
-        
-        cursor.close()
-        connection.close()
+        categories = get_db().get_categories()
         
+        # An empty list usually means the read failed, which is not worth caching
+        if categories:
+            response.headers["Cache-Control"] = PUBLIC_CACHE_CONTROL
         return {
             "categories": ["all"] + sorted(categories),
-            "available_filters": {
-                "all": "All Disasters",
-                "earthquake": "Earthquakes",
-                "flood": "Floods",
-                "fire": "Wildfires",
-                "storm": "Storms & Hurricanes",
-                "weather": "Extreme Weather",
-                "volcanic": "Volcanic Activity",
-                "landslide": "Landslides",
-                "tsunami": "Tsunamis",
-                "general": "General Disasters"
-            }
+            "available_filters": CATEGORY_FILTERS
         }
     except Exception as e:
         return {"categories": ["all", "general"], "error": str(e)}
@@ -923,7 +984,7 @@ async def force_update():
     """Manually trigger an immediate data update (bypasses hourly schedule)"""
     try:
         logging.info("🔄 Manual update triggered via API")
-        await fetch_and_classify_reddit_posts()
+        await run_reddit_update()
         return {
             "status": "success", 
             "message": "Manual update completed successfully",
@@ -934,34 +995,38 @@ async def force_update():
         raise HTTPException(status_code=503, detail=f"Manual update failed: {str(e)}")
 
 @app.post("/test-classification")
-async def test_classification(request: PredictionRequest):
+def test_classification(request: PredictionRequest):
     """Test the ML model classification on a single text"""
     try:
         result = classify_text(request.text)
         return {
             "text": request.text,
             "classification": result,
-            "model_status": "ML model" if ensemble_model is not None else "keyword fallback",
+            "model_status": "ML model" if svm_model is not None else "keyword fallback",
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Classification failed: {str(e)}")
 
 @app.get("/model-status")
-async def model_status():
+def model_status(response: Response, fresh: bool = Query(False, description="Re-run the test classification instead of reusing it")):
     """Check if ML models are loaded and working"""
-    global ensemble_model, vectorizer
+    global svm_model, vectorizer, model_probe
     
     try:
-        model_loaded = ensemble_model is not None and vectorizer is not None
+        model_loaded = svm_model is not None and vectorizer is not None
         
         if model_loaded:
             # Test with a simple classification
-            test_result = classify_text("Breaking: Official earthquake alert issued by USGS")
+            if fresh or model_probe is None or model_probe[0] is not svm_model or model_probe[1] is not vectorizer:
+                model_probe = (svm_model, vectorizer, classify_text(MODEL_PROBE_TEXT))
+            else:
+                response.headers["Cache-Control"] = PUBLIC_CACHE_CONTROL
+            test_result = model_probe[2]
             return {
                 "status": "ready",
                 "models_loaded": True,
-                "svm_model": str(type(ensemble_model).__name__),
+                "svm_model": str(type(svm_model).__name__),
                 "vectorizer": str(type(vectorizer).__name__),
                 "test_classification": test_result,
                 "message": "SVM model and TF-IDF vectorizer are loaded and working"
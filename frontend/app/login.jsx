@@ -51,7 +51,8 @@ export default function LoginScreen() {
     } catch (error) {
       console.error('💥 Login error:', error);
       console.error('Error details:', error.response?.data);
-      Alert.alert('Login Failed', 'Something went wrong. Please try again.');
+      // Rejected logins come back as HTTP errors carrying the reason in `detail`
+      Alert.alert('Login Failed', error.response?.data?.detail || 'Something went wrong. Please try again.');
     } finally {
       setLoading(false);
     }
@@ -1,6 +1,7 @@
 import React, { useState } from 'react';
 import { StyleSheet, Text, View, TextInput, TouchableOpacity, Alert, KeyboardAvoidingView, Platform, ScrollView } from 'react-native';
 import { Stack, router } from 'expo-router';
+import AsyncStorage from '@react-native-async-storage/async-storage';
 
 import Colors from '../constants/colors';
 import { disasterAPI } from '../services/api';
@@ -70,18 +71,18 @@ export default function SignupScreen() {
       });
 
       if (response.data.status === 'success') {
-        Alert.alert(
-          'Success', 
-          'Account created successfully! Please log in.',
-          [{ text: 'OK', onPress: () => router.replace('/login') }]
-        );
+        // Signup already signs the new user in, no separate login request needed
+        await AsyncStorage.setItem('access_token', response.data.access_token);
+        await AsyncStorage.setItem('user_info', JSON.stringify(response.data.user));
+        router.replace('/(tabs)/home');
       } else {
         Alert.alert('Signup Failed', response.data.message);
       }
 
     } catch (error) {
       console.error('Signup error:', error);
-      Alert.alert('Signup Failed', 'Something went wrong. Please try again.');
+      // Rejected signups come back as HTTP errors carrying the reason in `detail`
+      Alert.alert('Signup Failed', error.response?.data?.detail || 'Something went wrong. Please try again.');
     } finally {
       setLoading(false);
     }